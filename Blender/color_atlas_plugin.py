@@ -9,22 +9,65 @@ bl_info = {
 import bpy
 import bmesh
 import json
+import numpy as np
 from bpy.props import FloatVectorProperty, StringProperty, EnumProperty
 from bpy.types import Operator, Panel, PropertyGroup
 from bpy_extras.image_utils import load_image
 
+try:
+    import color_palette  # Without it, blocks stay in the scene's JSON color map
+except ImportError:
+    color_palette = None
+
 ATLAS_NAME = "MainColorAtlas"
 ATLAS_SIZE = 512
 BLOCK_SIZE = 8
+ATLAS_BLOCKS = 64
 INNER_SIZE = 4
 
 
+# Enum items must stay referenced while Blender shows them
+_color_enum_items = []
+
+
+def color_bytes(color):
+    return tuple(int(round(max(0.0, min(1.0, c)) * 255)) for c in color[:3])
+
 def encode_color_key(color):
-    return ",".join(str(round(c * 255)) for c in color)
+    return ",".join(str(c) for c in color_bytes(color))
 
 def decode_color_key(key):
     return tuple(int(k) / 255.0 for k in key.split(","))
 
+def packed_to_rgb(key):
+    return ((key >> 16 & 255) / 255.0, (key >> 8 & 255) / 255.0, (key & 255) / 255.0)
+
+def rgb_to_packed(color):
+    r, g, b = color_bytes(color)
+    return (r << 16) | (g << 8) | b
+
+
+class JsonAtlasBlocks:
+    """Atlas blocks kept in the scene's JSON color map when the shared palette is not installed"""
+
+    def __init__(self, props):
+        self.props = props
+        self.color_map = json.loads(props.color_index_map_json)
+
+    def atlas_block(self, color):
+        return self.color_map.get(encode_color_key(color), -1)
+
+    def set_atlas_block(self, color, block):
+        self.color_map[encode_color_key(color)] = block
+        self.props.color_index_map_json = json.dumps(self.color_map)
+
+    def next_atlas_block(self):
+        return max(self.color_map.values(), default=-1) + 1
+
+    def atlas_entries(self):
+        entries = [(rgb_to_packed(decode_color_key(key)), block) for key, block in self.color_map.items()]
+        return sorted(entries, key=lambda entry: entry[1])
+
 
 class ColorAtlasProperties(PropertyGroup):
     fill_color: FloatVectorProperty(
@@ -34,6 +77,7 @@ class ColorAtlasProperties(PropertyGroup):
         size=3,
         default=(1.0, 0.0, 1.0)
     )
+    # Migrated into the shared color palette when it is installed
     color_index_map_json: StringProperty(
         name="Serialized Color Map",
         default="{}"
@@ -44,19 +88,29 @@ class ColorAtlasProperties(PropertyGroup):
         items=lambda self, context: self.get_color_enum_items()
     )
 
-    def get_color_index_map(self):
-        return json.loads(self.color_index_map_json)
-
-    def set_color_index_map(self, color_map):
-        self.color_index_map_json = json.dumps(color_map)
-
     def get_color_enum_items(self):
-        color_map = self.get_color_index_map()
-        items = []
-        for key, idx in color_map.items():
-            label = f"#{''.join(f'{int(k):02X}' for k in key.split(','))}"
-            items.append((key, label, f"Block {idx}"))
-        return items
+        entries = dict(get_atlas_palette(self, migrate=False).atlas_entries())
+        # Blocks of an old file that have not been migrated yet
+        for key, block in json.loads(self.color_index_map_json).items():
+            entries.setdefault(rgb_to_packed(decode_color_key(key)), block)
+        _color_enum_items[:] = [
+            (encode_color_key(packed_to_rgb(key)), f"#{key:06X}", f"Block {block}")
+            for key, block in sorted(entries.items(), key=lambda item: item[1])
+        ]
+        return _color_enum_items
+
+
+def get_atlas_palette(props, migrate=True):
+    if color_palette is None:
+        return JsonAtlasBlocks(props)
+    palette = color_palette.get_palette()
+    if migrate and props.color_index_map_json != "{}":
+        # Move blocks from the old per-scene JSON map into the shared palette
+        for key, index in json.loads(props.color_index_map_json).items():
+            if palette.atlas_block(decode_color_key(key)) < 0:
+                palette.set_atlas_block(decode_color_key(key), index)
+        props.color_index_map_json = "{}"
+    return palette
 
 
 def get_or_create_atlas():
@@ -95,30 +149,26 @@ def ensure_material_with_texture(image):
 
 
 def get_or_assign_color_index(color, props):
-    color_map = props.get_color_index_map()
-    key = encode_color_key(color)
-    if key in color_map:
-        return color_map[key]
-    index = len(color_map)
-    if index >= 64:
-        raise RuntimeError("Color atlas full (max 64 colors)")
-    color_map[key] = index
-    props.set_color_index_map(color_map)
+    palette = get_atlas_palette(props)
+    index = palette.atlas_block(color)
+    if index >= 0:
+        return index
+    index = palette.next_atlas_block()
+    if index >= ATLAS_BLOCKS:
+        raise RuntimeError(f"Color atlas full (max {ATLAS_BLOCKS} colors)")
+    palette.set_atlas_block(color, index)
     return index
 
 
 def write_color_to_atlas(image, color_index, color):
     x = (color_index % 8) * BLOCK_SIZE
     y = (color_index // 8) * BLOCK_SIZE
-    pixels = list(image.pixels)
-    for j in range(BLOCK_SIZE):
-        for i in range(BLOCK_SIZE):
-            px = (y + j) * ATLAS_SIZE + (x + i)
-            idx = px * 4
-            r, g, b = color
-            pixels[idx:idx + 3] = [r, g, b]
-            pixels[idx + 3] = 1.0
-    image.pixels = pixels
+    pixels = np.empty(ATLAS_SIZE * ATLAS_SIZE * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    block = pixels.reshape(ATLAS_SIZE, ATLAS_SIZE, 4)[y:y + BLOCK_SIZE, x:x + BLOCK_SIZE]
+    block[..., :3] = color[:3]
+    block[..., 3] = 1.0
+    image.pixels.foreach_set(pixels)
     image.update()
 
 
@@ -189,9 +239,8 @@ class UV_OT_assign_existing_block(Operator):
         props = context.scene.color_atlas_props
         key = props.selected_color
         color = decode_color_key(key)
-        color_map = props.get_color_index_map()
-        color_index = color_map.get(key)
-        if color_index is None:
+        color_index = get_atlas_palette(props).atlas_block(color)
+        if color_index < 0:
             self.report({'ERROR'}, "Selected color not in atlas")
             return {'CANCELLED'}
 
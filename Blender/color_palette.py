@@ -0,0 +1,188 @@
+"""Shared color palette for the color add-ons.
+
+Colors are packed as 0xRRGGBB into a uint32 array with a dict index. Each entry
+can point at a solid color material, a 1x1 color image, a material built on
+that image and a block of the color atlas, so face.py, doFaceColor.py and
+color_atlas_plugin.py resolve a color without scanning bpy.data by name. The
+palette is one per .blend file, stored as an ID property on a Text datablock
+so every scene shares it.
+
+This is a helper module, not an add-on: install it next to the add-ons that
+use it. They still work without it, falling back to lookups by name.
+"""
+
+import random
+
+import bpy
+import numpy as np
+
+PALETTE_PROP = "shared_color_palette"
+HOLDER_NAME = "SharedColorPalette"
+MATERIAL_KINDS = ("solid", "image")
+
+
+# --- Color Keys ---
+def rgb_to_bytes(rgb):
+    return tuple(int(round(max(0.0, min(1.0, c)) * 255)) for c in rgb[:3])
+
+
+def rgb_to_key(rgb):
+    r, g, b = rgb_to_bytes(rgb)
+    return (r << 16) | (g << 8) | b
+
+
+# --- Storage ---
+def palette_holder(create=False):
+    """Text datablock holding the palette of the open file"""
+    holder = bpy.data.texts.get(HOLDER_NAME)
+    if holder is None and create:
+        holder = bpy.data.texts.new(HOLDER_NAME)
+        holder.use_fake_user = True
+        holder.write("Shared color palette of the color add-ons, stored in this text's custom properties.\n")
+    return holder
+
+
+def palette_data():
+    holder = palette_holder()
+    if holder is not None:
+        return holder.get(PALETTE_PROP)
+    # Files saved before the palette moved off the scene
+    return next((scene[PALETTE_PROP] for scene in bpy.data.scenes if PALETTE_PROP in scene), None)
+
+
+# --- Palette ---
+class ColorPalette:
+    """Colors of the open file with their materials, image and atlas block"""
+
+    def __init__(self):
+        data = palette_data()
+        if data is None:
+            data = {"token": random.getrandbits(30), "generation": 0}
+        self.token = int(data.get("token", 0))
+        self.generation = int(data.get("generation", 0))
+
+        keys = np.array(data.get("keys", ()), dtype=np.uint32)
+        self.count = len(keys)
+        self.keys = np.zeros(max(self.count, 16), dtype=np.uint32)
+        self.keys[:self.count] = keys
+        self.blocks = np.full(len(self.keys), -1, dtype=np.int16)
+        self.blocks[:self.count] = np.array(data.get("blocks", ()), dtype=np.int16)[:self.count]
+
+        images = list(data.get("images", ()))
+        self.images = images + [""] * (self.count - len(images))
+        materials = data.get("materials", {})
+        self.materials = {}
+        for kind in MATERIAL_KINDS:
+            names = list(materials.get(kind, ()))
+            self.materials[kind] = names + [""] * (self.count - len(names))
+
+        self.index = {int(k): i for i, k in enumerate(self.keys[:self.count])}
+        # Resolved ID blocks, validated on use so undo and deletes are safe
+        self._ids = {}
+
+    # Index
+    def find(self, rgb):
+        return self.index.get(rgb_to_key(rgb), -1)
+
+    def add(self, rgb):
+        key = rgb_to_key(rgb)
+        slot = self.index.get(key)
+        if slot is not None:
+            return slot
+        if self.count == len(self.keys):
+            self.keys = np.concatenate((self.keys, np.zeros_like(self.keys)))
+            self.blocks = np.concatenate((self.blocks, np.full_like(self.blocks, -1)))
+        slot = self.count
+        self.keys[slot] = key
+        self.blocks[slot] = -1
+        self.images.append("")
+        for names in self.materials.values():
+            names.append("")
+        self.index[key] = slot
+        self.count += 1
+        self._store()
+        return slot
+
+    # Linked data
+    def material(self, rgb, kind="solid"):
+        slot = self.find(rgb)
+        if slot < 0:
+            return None
+        return self._resolve(bpy.data.materials, self.materials[kind], slot, kind)
+
+    def set_material(self, rgb, mat, kind="solid"):
+        slot = self.add(rgb)
+        self.materials[kind][slot] = mat.name
+        self._ids[(kind, slot)] = mat
+        self._store()
+
+    def image(self, rgb):
+        slot = self.find(rgb)
+        if slot < 0:
+            return None
+        return self._resolve(bpy.data.images, self.images, slot, "image_data")
+
+    def set_image(self, rgb, image):
+        slot = self.add(rgb)
+        self.images[slot] = image.name
+        self._ids[("image_data", slot)] = image
+        self._store()
+
+    def atlas_block(self, rgb):
+        slot = self.find(rgb)
+        return -1 if slot < 0 else int(self.blocks[slot])
+
+    def set_atlas_block(self, rgb, block):
+        slot = self.add(rgb)
+        self.blocks[slot] = block
+        self._store()
+
+    def atlas_entries(self):
+        """(key, block) pairs for colors placed in the atlas, in block order"""
+        slots = np.flatnonzero(self.blocks[:self.count] >= 0)
+        slots = slots[np.argsort(self.blocks[slots], kind='stable')]
+        return [(int(self.keys[s]), int(self.blocks[s])) for s in slots]
+
+    def next_atlas_block(self):
+        used = self.blocks[:self.count]
+        return int(used.max()) + 1 if self.count and used.max() >= 0 else 0
+
+    # Storage
+    def _resolve(self, collection, names, slot, kind):
+        ref = self._ids.get((kind, slot))
+        if ref is not None:
+            try:
+                if ref.name == names[slot]:
+                    return ref
+            except ReferenceError:
+                pass
+        ref = collection.get(names[slot]) if names[slot] else None
+        if ref is None:
+            self._ids.pop((kind, slot), None)
+        else:
+            self._ids[(kind, slot)] = ref
+        return ref
+
+    def _store(self):
+        self.generation += 1
+        palette_holder(create=True)[PALETTE_PROP] = {
+            "token": self.token,
+            "generation": self.generation,
+            "keys": [int(k) for k in self.keys[:self.count]],
+            "blocks": [int(b) for b in self.blocks[:self.count]],
+            "images": self.images,
+            "materials": {kind: names for kind, names in self.materials.items()},
+        }
+
+
+_palette = None
+
+
+def get_palette():
+    """Return the cached palette, reloading it after undo or file load"""
+    global _palette
+    data = palette_data()
+    stamp = (int(data.get("token", 0)), int(data.get("generation", 0))) if data else None
+    if _palette is None or (_palette.token, _palette.generation) != stamp or not data:
+        _palette = ColorPalette()
+    return _palette
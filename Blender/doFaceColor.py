@@ -12,27 +12,44 @@ from bpy.types import Panel, Operator, PropertyGroup
 from bpy.props import FloatVectorProperty, StringProperty, PointerProperty
 
 
+try:
+    import color_palette  # Without it, images and materials are looked up by name
+except ImportError:
+    color_palette = None
+
+
 def clamp_color(c):
     return max(0.0, min(1.0, c))
 
 
+def color_bytes(color):
+    return tuple(int(round(clamp_color(c) * 255)) for c in color[:3])
+
+
+def rgb_to_hex(color):
+    return "{:02x}{:02x}{:02x}".format(*color_bytes(color))
+
+
+def hex_to_rgb(hex_string):
+    hex_val = hex_string.strip().lstrip('#')
+    try:
+        if len(hex_val) == 6:
+            return tuple(int(hex_val[i:i + 2], 16) / 255.0 for i in (0, 2, 4))
+    except ValueError:
+        pass
+    return None
+
+
 class Paint3DColorProperties(PropertyGroup):
     def update_fill_color(self, context):
-        r = int(round(clamp_color(self.fill_color[0]) * 255))
-        g = int(round(clamp_color(self.fill_color[1]) * 255))
-        b = int(round(clamp_color(self.fill_color[2]) * 255))
-        self.hex_string = f"{r:02x}{g:02x}{b:02x}"
+        hex_string = rgb_to_hex(self.fill_color)
+        if hex_string != self.hex_string:
+            self.hex_string = hex_string
 
     def update_hex_string(self, context):
-        try:
-            hex_val = self.hex_string.strip().lstrip('#')
-            if len(hex_val) == 6:
-                r = int(hex_val[0:2], 16) / 255.0
-                g = int(hex_val[2:4], 16) / 255.0
-                b = int(hex_val[4:6], 16) / 255.0
-                self.fill_color = (r, g, b, 1.0)
-        except Exception:
-            pass
+        rgb = hex_to_rgb(self.hex_string)
+        if rgb is not None and rgb_to_hex(rgb) != rgb_to_hex(self.fill_color):
+            self.fill_color = (*rgb, 1.0)
 
     fill_color: FloatVectorProperty(
         name="Fill Color",
@@ -50,36 +67,40 @@ class Paint3DColorProperties(PropertyGroup):
     )
 
 
-def create_color_image(hex_code, color):
-    image_name = f"color_{hex_code}"
+def create_color_image(palette, hex_code, color):
+    image = palette.image(color) if palette else None
+    if image:
+        return image
 
-    if image_name in bpy.data.images:
-        return bpy.data.images[image_name]
-
-    r_byte = int(round(color[0] * 255))
-    g_byte = int(round(color[1] * 255))
-    b_byte = int(round(color[2] * 255))
-    a_byte = int(round(color[3] * 255))
-
-    r = r_byte / 255.0
-    g = g_byte / 255.0
-    b = b_byte / 255.0
-    a = a_byte / 255.0
-
-    image = bpy.data.images.new(image_name, width=1, height=1, alpha=True)
-    image.colorspace_settings.name = 'Non-Color'
-    image.pixels = [r, g, b, a]
-    image.pack()
+    image_name = f"color_{hex_code}"
+    image = bpy.data.images.get(image_name)
+    if image is None:
+        r, g, b = (c / 255.0 for c in color_bytes(color))
+        a = int(round(clamp_color(color[3]) * 255)) / 255.0
+
+        image = bpy.data.images.new(image_name, width=1, height=1, alpha=True)
+        image.colorspace_settings.name = 'Non-Color'
+        image.pixels = [r, g, b, a]
+        image.pack()
+
+    if palette:
+        palette.set_image(color, image)
     return image
 
 
-def create_material_with_image(hex_code, color):
-    mat_name = f"color_{hex_code}"
+def create_material_with_image(palette, hex_code, color):
+    mat = palette.material(color, kind="image") if palette else None
+    if mat:
+        return mat
 
-    if mat_name in bpy.data.materials:
-        return bpy.data.materials[mat_name]
+    mat_name = f"color_{hex_code}"
+    mat = bpy.data.materials.get(mat_name)
+    if mat is not None:
+        if palette:
+            palette.set_material(color, mat, kind="image")
+        return mat
 
-    image = create_color_image(hex_code, color)
+    image = create_color_image(palette, hex_code, color)
 
     mat = bpy.data.materials.new(name=mat_name)
     mat.use_nodes = True
@@ -104,6 +125,8 @@ def create_material_with_image(hex_code, color):
     links.new(tex_node.outputs["Color"], bsdf.inputs["Base Color"])
     links.new(bsdf.outputs["BSDF"], output_node.inputs["Surface"])
 
+    if palette:
+        palette.set_material(color, mat, kind="image")
     return mat
 
 
@@ -129,11 +152,13 @@ class MESH_OT_fill_color_faces(Operator):
 
         bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.001)
 
-        mat = create_material_with_image(hex_code, color)
+        palette = color_palette.get_palette() if color_palette else None
+        mat = create_material_with_image(palette, hex_code, color)
 
-        if mat.name not in [m.name for m in obj.data.materials]:
-            obj.data.materials.append(mat)
         mat_index = obj.data.materials.find(mat.name)
+        if mat_index < 0:
+            obj.data.materials.append(mat)
+            mat_index = len(obj.data.materials) - 1
 
         for face in bm.faces:
             if face.select:
@@ -10,37 +10,415 @@ bl_info = {
 
 import bpy
 import bmesh
+import hashlib
 import re
+import numpy as np
+from bpy_extras.io_utils import ExportHelper, ImportHelper
 from bpy.props import FloatVectorProperty, StringProperty, PointerProperty
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty
 from bpy.types import Operator, Panel, PropertyGroup
 
+try:
+    import color_palette  # Without it, materials are found by name only
+except ImportError:
+    color_palette = None
+
 
 # --- HEX to RGB Helper ---
 def hex_to_rgb_float(hex_code):
     hex_code = hex_code.strip().lstrip('#')
     if len(hex_code) != 6 or not re.match(r'^[0-9A-Fa-f]{6}$', hex_code):
         return None
-    r = int(hex_code[0:2], 16) / 255.0
-    g = int(hex_code[2:4], 16) / 255.0
-    b = int(hex_code[4:6], 16) / 255.0
-    return (r, g, b)
+    return key_to_rgb(int(hex_code, 16))
+
+
+def pack_colors(colors):
+    """Colors of an (N, 3+) float array as 0xRRGGBB integers"""
+    rgb = np.round(np.clip(np.asarray(colors)[:, :3], 0.0, 1.0) * 255).astype(np.uint32)
+    return (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+
+def key_to_rgb(key):
+    return ((key >> 16 & 255) / 255.0, (key >> 8 & 255) / 255.0, (key & 255) / 255.0)
 
 
 # --- Create or Retrieve Material by Hex Color ---
 def get_or_create_color_material(color_hex, rgb):
+    palette = color_palette.get_palette() if color_palette else None
+    mat = palette.material(rgb) if palette else None
+    if mat:
+        return mat
+
     name = f"Mat_{color_hex.upper().lstrip('#')}"
-    if name in bpy.data.materials:
-        return bpy.data.materials[name]
+    mat = bpy.data.materials.get(name)
+    if mat is None:
+        mat = bpy.data.materials.new(name)
+        mat.use_nodes = True
+        bsdf = mat.node_tree.nodes.get("Principled BSDF")
+        if bsdf:
+            bsdf.inputs["Base Color"].default_value = (*rgb, 1.0)
+            if "Specular" in bsdf.inputs:
+                bsdf.inputs["Specular"].default_value = 0.1
+
+    if palette:
+        palette.set_material(rgb, mat)
+    return mat
 
-    mat = bpy.data.materials.new(name)
-    mat.use_nodes = True
-    bsdf = mat.node_tree.nodes.get("Principled BSDF")
-    if bsdf:
-        bsdf.inputs["Base Color"].default_value = (*rgb, 1.0)
-    if "Specular" in bsdf.inputs:
-        bsdf.inputs["Specular"].default_value = 0.1
 
-    return mat
+def rgb_to_hex_label(rgb):
+    return "#{:06X}".format(int(pack_colors([rgb])[0]))
+
+
+# --- Texture Sampling Helpers ---
+def find_active_image(obj):
+    """Return the active (or first) image texture of the object's active material"""
+    return find_material_image(obj.active_material)
+
+
+def find_material_image(mat):
+    if not mat or not mat.use_nodes:
+        return None
+    node = mat.node_tree.nodes.active
+    if node and node.type == 'TEX_IMAGE' and node.image:
+        return node.image
+    for node in mat.node_tree.nodes:
+        if node.type == 'TEX_IMAGE' and node.image:
+            return node.image
+    return None
+
+
+def srgb_to_linear(rgb):
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def read_image_pixels(image):
+    """Pixels as linear RGB, matching material Base Color and the Non-Color atlas"""
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    rgb = pixels.reshape(-1, 4)[:, :3]
+    # Byte images keep their encoded values, float buffers are already linear
+    if image.colorspace_settings.name == 'sRGB' and not image.is_float:
+        rgb = srgb_to_linear(rgb).astype(np.float32)
+    return rgb, width, height
+
+
+def sample_pixels(pixels, width, height, uv):
+    # Nearest pixel lookup with repeat wrapping, one gather for all points
+    x = (np.mod(uv[:, 0], 1.0) * width).astype(np.int64)
+    y = (np.mod(uv[:, 1], 1.0) * height).astype(np.int64)
+    np.clip(x, 0, width - 1, out=x)
+    np.clip(y, 0, height - 1, out=y)
+    return pixels[y * width + x]
+
+
+def polygon_loop_ranges(mesh):
+    count = len(mesh.polygons)
+    starts = np.empty(count, dtype=np.int64)
+    totals = np.empty(count, dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", starts)
+    mesh.polygons.foreach_get("loop_total", totals)
+    return starts, totals
+
+
+def read_loop_uvs(mesh):
+    uv = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+    mesh.uv_layers.active.data.foreach_get("uv", uv)
+    return uv.reshape(-1, 2)
+
+
+def sample_face_colors(mesh, image, mode='CENTROID'):
+    """Sample an image per face, at the UV centroid or averaged over the face"""
+    pixels, width, height = read_image_pixels(image)
+    starts, totals = polygon_loop_ranges(mesh)
+    uv = read_loop_uvs(mesh)
+
+    centroids = np.add.reduceat(uv, starts, axis=0) / totals[:, None]
+    colors = sample_pixels(pixels, width, height, centroids)
+    if mode == 'CENTROID':
+        return colors
+
+    # Corners pulled halfway to the centroid stay clear of seams and neighbours
+    loop_face = np.repeat(np.arange(len(starts)), totals)
+    inner = (uv + centroids[loop_face]) * 0.5
+    corners = np.add.reduceat(sample_pixels(pixels, width, height, inner), starts, axis=0)
+    return (colors + corners) / (totals + 1)[:, None]
+
+
+def face_texture_colors(mesh):
+    """Each face sampled at its UV centroid from the image of its own material
+
+    Faces whose material has no image keep the material's flat color.
+    Returns (colors, textured) where textured counts the sampled faces.
+    """
+    colors = face_material_colors(mesh)
+    material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    starts, totals = polygon_loop_ranges(mesh)
+    if not len(starts):
+        return colors, 0
+    centroids = np.add.reduceat(read_loop_uvs(mesh), starts, axis=0) / totals[:, None]
+
+    textured = 0
+    for slot, mat in enumerate(mesh.materials):
+        image = find_material_image(mat)
+        faces = np.flatnonzero(material_index == slot)
+        if not image or image.size[0] == 0 or not len(faces):
+            continue
+        pixels, width, height = read_image_pixels(image)
+        colors[faces] = sample_pixels(pixels, width, height, centroids[faces])
+        textured += len(faces)
+    return colors, textured
+
+
+def quantize_colors(colors, levels, max_colors):
+    """Snap colors to a per-channel grid and merge rare ones into the most used
+
+    Returns (palette, palette_index) where palette_index maps each input row.
+    """
+    steps = max(levels - 1, 1)
+    snapped = np.round(np.clip(colors, 0.0, 1.0) * steps) / steps
+    # Grid points are at least one byte apart, so packed keys stay distinct
+    keys, first, inverse, counts = np.unique(pack_colors(snapped), return_index=True,
+                                             return_inverse=True, return_counts=True)
+    palette = snapped[first]
+    inverse = inverse.reshape(-1)
+
+    if len(palette) > max_colors:
+        keep = np.argsort(counts)[::-1][:max_colors]
+        remap = np.empty(len(palette), dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
+        dropped = np.ones(len(palette), dtype=bool)
+        dropped[keep] = False
+        dropped = np.flatnonzero(dropped)
+        # Only dropped colors look for their nearest kept one, a chunk at a time.
+        # |a - b|^2 ranks like |b|^2 - 2 a.b, which is one matrix product per chunk
+        kept = palette[keep]
+        kept_sq = (kept ** 2).sum(axis=1)
+        for start in range(0, len(dropped), 65536):
+            chunk = dropped[start:start + 65536]
+            remap[chunk] = np.argmin(kept_sq - 2.0 * palette[chunk] @ kept.T, axis=1)
+        inverse = remap[inverse]
+        palette = kept
+    return palette, inverse
+
+
+def assign_palette_materials(mesh, face_indices, palette, palette_index):
+    slot_of_color = np.empty(len(palette), dtype=np.int32)
+    for i, rgb in enumerate(palette):
+        rgb = tuple(float(c) for c in rgb)
+        mat = get_or_create_color_material(rgb_to_hex_label(rgb), rgb)
+        slot = mesh.materials.find(mat.name)
+        if slot < 0:
+            mesh.materials.append(mat)
+            slot = len(mesh.materials) - 1
+        slot_of_color[i] = slot
+
+    material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    material_index[face_indices] = slot_of_color[palette_index]
+    mesh.polygons.foreach_set("material_index", material_index)
+
+
+def assign_palette_atlas(context, mesh, face_indices, palette, palette_index):
+    # The atlas layout and its color map live in the Color Atlas Filler add-on
+    import color_atlas_plugin as atlas
+
+    props = context.scene.color_atlas_props
+    # Check the room left before any block or pixel is written
+    atlas_palette = atlas.get_atlas_palette(props)
+    needed = sum(1 for rgb in palette if atlas_palette.atlas_block(tuple(float(c) for c in rgb)) < 0)
+    free = atlas.ATLAS_BLOCKS - atlas_palette.next_atlas_block()
+    if needed > free:
+        raise RuntimeError(f"Color atlas has room for {free} more colors, {needed} needed; lower Max Colors")
+
+    image = atlas.get_or_create_atlas()
+    blocks = []
+    for rgb in palette:
+        rgb = tuple(float(c) for c in rgb)
+        block = atlas.get_or_assign_color_index(rgb, props)
+        atlas.write_color_to_atlas(image, block, rgb)
+        blocks.append(atlas.get_uv_coords(block))
+    block_uvs = np.array(blocks, dtype=np.float32)
+
+    starts, totals = polygon_loop_ranges(mesh)
+    face_color = np.full(len(starts), -1, dtype=np.int64)
+    face_color[face_indices] = palette_index
+    loop_face = np.repeat(np.arange(len(starts)), totals)
+    loop_color = face_color[loop_face]
+    loop_corner = (np.arange(len(loop_face)) - starts[loop_face]) % 4
+    painted = loop_color >= 0
+
+    uv = read_loop_uvs(mesh)
+    uv[painted] = block_uvs[loop_color[painted], loop_corner[painted]]
+    mesh.uv_layers.active.data.foreach_set("uv", uv.ravel())
+
+    mat = atlas.ensure_material_with_texture(image)
+    slot = mesh.materials.find(mat.name)
+    if slot < 0:
+        mesh.materials.append(mat)
+        slot = len(mesh.materials) - 1
+    material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    material_index[face_indices] = slot
+    mesh.polygons.foreach_set("material_index", material_index)
+
+
+# --- Per-Face Color Readers ---
+def material_base_color(mat):
+    """Flat color of a material: Principled base color, 1x1 color image or viewport color"""
+    if mat is None:
+        return (1.0, 1.0, 1.0)
+    if mat.use_nodes:
+        bsdf = next((n for n in mat.node_tree.nodes if n.type == 'BSDF_PRINCIPLED'), None)
+        if bsdf:
+            socket = bsdf.inputs["Base Color"]
+            if not socket.is_linked:
+                return tuple(socket.default_value[:3])
+            node = socket.links[0].from_node
+            if node.type == 'TEX_IMAGE' and node.image and tuple(node.image.size) == (1, 1):
+                return tuple(node.image.pixels[:3])
+    return tuple(mat.diffuse_color[:3])
+
+
+def face_material_colors(mesh):
+    slot_colors = np.array([material_base_color(m) for m in mesh.materials] or [(1.0, 1.0, 1.0)],
+                           dtype=np.float32)
+    material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    np.clip(material_index, 0, len(slot_colors) - 1, out=material_index)
+    return slot_colors[material_index]
+
+
+def face_attribute_colors(mesh):
+    """Active color attribute reduced to one color per face, or None"""
+    if hasattr(mesh, "color_attributes"):
+        attr = mesh.color_attributes.active_color
+        domain = attr.domain if attr else None
+    else:
+        # Before Blender 3.2 only face corner vertex colors exist
+        attr = mesh.vertex_colors.active
+        domain = 'CORNER'
+    if attr is None:
+        return None
+    values = np.empty(len(attr.data) * 4, dtype=np.float32)
+    attr.data.foreach_get("color", values)
+    values = values.reshape(-1, 4)[:, :3]
+    if domain == 'FACE':
+        return values
+
+    starts, totals = polygon_loop_ranges(mesh)
+    if domain == 'POINT':
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int64)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        values = values[loop_verts]
+    return np.add.reduceat(values, starts, axis=0) / totals[:, None]
+
+
+def select_faces(mesh, face_mask):
+    """Write face selection and flush it to edges and vertices in one pass each"""
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int64)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    starts, totals = polygon_loop_ranges(mesh)
+    loop_mask = np.repeat(face_mask, totals)
+
+    vert_mask = np.zeros(len(mesh.vertices), dtype=bool)
+    edge_mask = np.zeros(len(mesh.edges), dtype=bool)
+    vert_mask[loop_verts[loop_mask]] = True
+    edge_mask[loop_edges[loop_mask]] = True
+
+    mesh.vertices.foreach_set("select", vert_mask)
+    mesh.edges.foreach_set("select", edge_mask)
+    mesh.polygons.foreach_set("select", face_mask)
+
+
+# --- Face Color Layout Files ---
+def topology_hash(mesh):
+    """Hash of vertex count and face corner connectivity, ignoring positions"""
+    totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", totals)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.int64(len(mesh.vertices)).tobytes())
+    digest.update(totals.tobytes())
+    digest.update(loop_verts.tobytes())
+    return digest.hexdigest()
+
+
+def face_material_slots(mesh):
+    material_index = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    return np.clip(material_index, 0, max(len(mesh.materials) - 1, 0), out=material_index)
+
+
+def save_face_layout(filepath, mesh):
+    """Save each face's material name, with its flat color as a fallback"""
+    keys = pack_colors(face_material_colors(mesh))
+    palette, face_index = np.unique(keys, return_inverse=True)
+    index_type = np.uint8 if len(palette) <= 256 else np.uint16 if len(palette) <= 65536 else np.uint32
+    names = [mat.name if mat else "" for mat in mesh.materials] or [""]
+    np.savez_compressed(
+        filepath,
+        palette=palette.astype(np.uint32),
+        face_index=face_index.reshape(-1).astype(index_type),
+        material_names=np.array(names, dtype=str),
+        face_material=face_material_slots(mesh).astype(np.uint16 if len(names) <= 65536 else np.uint32),
+        topology=np.array(topology_hash(mesh)),
+    )
+    return len(palette)
+
+
+def check_layout_index(name, index, face_count, size):
+    if len(index) != face_count:
+        raise ValueError(f"Layout '{name}' has {len(index)} faces, mesh has {face_count}")
+    if len(index) and (int(index.min()) < 0 or int(index.max()) >= size):
+        raise ValueError(f"Layout '{name}' points past its {size} entries")
+
+
+def load_face_layout(filepath, mesh):
+    """Apply a saved layout: materials by name, flat colors where a material is missing.
+
+    Returns the number of faces that fell back to a color material.
+    """
+    face_count = len(mesh.polygons)
+    with np.load(filepath) as data:
+        if str(data["topology"]) != topology_hash(mesh):
+            raise ValueError("Layout was saved from a mesh with different topology")
+        palette = data["palette"]
+        face_index = data["face_index"].astype(np.int64)
+        # Layouts from older versions only hold colors
+        names = data["material_names"].tolist() if "material_names" in data.files else []
+        face_material = data["face_material"].astype(np.int64) if "face_material" in data.files else None
+    check_layout_index("face_index", face_index, face_count, len(palette))
+
+    resolved = np.zeros(face_count, dtype=bool)
+    if face_material is not None:
+        check_layout_index("face_material", face_material, face_count, len(names))
+        slot_of_name = np.full(len(names), -1, dtype=np.int32)
+        for i, name in enumerate(names):
+            mat = bpy.data.materials.get(name) if name else None
+            if mat is None:
+                continue
+            slot = mesh.materials.find(mat.name)
+            if slot < 0:
+                mesh.materials.append(mat)
+                slot = len(mesh.materials) - 1
+            slot_of_name[i] = slot
+        face_slot = slot_of_name[face_material]
+        resolved = face_slot >= 0
+        material_index = face_material_slots(mesh)
+        material_index[resolved] = face_slot[resolved]
+        mesh.polygons.foreach_set("material_index", material_index)
+
+    missing = np.flatnonzero(~resolved)
+    if len(missing):
+        used, used_index = np.unique(face_index[missing], return_inverse=True)
+        colors = [key_to_rgb(int(key)) for key in palette[used]]
+        assign_palette_materials(mesh, missing, colors, used_index.reshape(-1))
+    return len(missing)
 
 
 # --- Property Group ---
@@ -79,16 +457,13 @@ class FACECOLOR_OT_apply_material(bpy.types.Operator):
             self.report({'WARNING'}, "Invalid hex color, using color picker")
             rgb = props.color_picker
 
-        hex_label = props.hex_color.strip().upper() if re.match(r'^#?[0-9A-Fa-f]{6}$', props.hex_color.strip()) else \
-                    "#{:02X}{:02X}{:02X}".format(int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255))
-
-        mat = get_or_create_color_material(hex_label, rgb)
+        mat = get_or_create_color_material(rgb_to_hex_label(rgb), tuple(rgb))
 
         # Ensure material exists on the object material slots
-        if mat.name not in [m.name for m in obj.data.materials]:
-            obj.data.materials.append(mat)
-
         mat_index = obj.data.materials.find(mat.name)
+        if mat_index < 0:
+            obj.data.materials.append(mat)
+            mat_index = len(obj.data.materials) - 1
 
         bm = bmesh.from_edit_mesh(obj.data)
         bm.faces.ensure_lookup_table()
@@ -102,6 +477,225 @@ class FACECOLOR_OT_apply_material(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class FACECOLOR_OT_sample_texture(bpy.types.Operator):
+    bl_idname = "mesh.face_sample_texture_colors"
+    bl_label = "Colors from Texture"
+    bl_description = "Sample the active image texture per selected face and assign flat color materials or atlas blocks"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    sample_mode: EnumProperty(
+        name="Sample",
+        items=[('CENTROID', "UV Centroid", "Sample the pixel at each face's UV centroid"),
+               ('AVERAGE', "Face Average", "Average samples across each face")],
+        default='CENTROID'
+    )
+    levels: IntProperty(
+        name="Levels",
+        description="Quantization steps per color channel",
+        min=2, max=256,
+        default=16
+    )
+    max_colors: IntProperty(
+        name="Max Colors",
+        description="Merge the least used colors until at most this many remain",
+        min=1, max=256,
+        default=32
+    )
+    target: EnumProperty(
+        name="Target",
+        items=[('MATERIAL', "Color Materials", "Assign one solid color material per palette entry"),
+               ('ATLAS', "Color Atlas", "Map faces to blocks in the shared color atlas")],
+        default='MATERIAL'
+    )
+
+    def execute(self, context):
+        obj = context.edit_object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Must be in Edit Mode with a mesh object selected")
+            return {'CANCELLED'}
+
+        image = find_active_image(obj)
+        if not image or image.size[0] == 0:
+            self.report({'ERROR'}, "Active material has no image texture")
+            return {'CANCELLED'}
+        # A disabled add-on can still be imported, its scene properties are what is missing
+        if self.target == 'ATLAS' and not hasattr(context.scene, "color_atlas_props"):
+            self.report({'ERROR'}, "Color Atlas Filler add-on is not enabled")
+            return {'CANCELLED'}
+        if not obj.data.uv_layers.active:
+            self.report({'ERROR'}, "Mesh has no UV map to sample with")
+            return {'CANCELLED'}
+
+        # Bulk reads and writes need the object mode mesh, not the BMesh
+        bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            mesh = obj.data
+            selected = np.zeros(len(mesh.polygons), dtype=bool)
+            mesh.polygons.foreach_get("select", selected)
+            face_indices = np.flatnonzero(selected)
+            if not len(face_indices):
+                self.report({'WARNING'}, "No faces selected")
+                return {'CANCELLED'}
+
+            colors = sample_face_colors(mesh, image, self.sample_mode)[face_indices]
+            palette, palette_index = quantize_colors(colors, self.levels, self.max_colors)
+
+            if self.target == 'ATLAS':
+                try:
+                    assign_palette_atlas(context, mesh, face_indices, palette, palette_index)
+                except ImportError:
+                    self.report({'ERROR'}, "Color Atlas Filler add-on is not enabled")
+                    return {'CANCELLED'}
+                except RuntimeError as e:
+                    self.report({'ERROR'}, str(e))
+                    return {'CANCELLED'}
+            else:
+                assign_palette_materials(mesh, face_indices, palette, palette_index)
+            mesh.update()
+        finally:
+            bpy.ops.object.mode_set(mode='EDIT')
+
+        self.report({'INFO'}, f"Colored {len(face_indices)} faces with {len(palette)} colors")
+        return {'FINISHED'}
+
+
+class FACECOLOR_OT_select_similar_color(bpy.types.Operator):
+    bl_idname = "mesh.face_select_similar_color"
+    bl_label = "Select Faces by Color"
+    bl_description = "Select faces whose color is close to the tool color or the active face"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source: EnumProperty(
+        name="Color From",
+        items=[('MATERIAL', "Material", "Base color of each face's material"),
+               ('TEXTURE', "Texture / Atlas", "Image texture of each face's material, sampled at its UV centroid"),
+               ('ATTRIBUTE', "Color Attribute", "Active color attribute averaged per face")],
+        default='MATERIAL'
+    )
+    reference: EnumProperty(
+        name="Reference",
+        items=[('TOOL', "Tool Color", "Hex color, or the color picker when the hex is invalid"),
+               ('ACTIVE', "Active Face", "Color of the active face")],
+        default='TOOL'
+    )
+    threshold: FloatProperty(
+        name="Threshold",
+        description="Maximum RGB distance from the reference color",
+        min=0.0, max=1.8,
+        default=0.1
+    )
+    extend: BoolProperty(
+        name="Extend",
+        description="Add to the current selection instead of replacing it",
+        default=False
+    )
+
+    def execute(self, context):
+        obj = context.edit_object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Must be in Edit Mode with a mesh object selected")
+            return {'CANCELLED'}
+
+        bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            mesh = obj.data
+            if self.source == 'MATERIAL':
+                colors = face_material_colors(mesh)
+            elif self.source == 'TEXTURE':
+                if not mesh.uv_layers.active:
+                    self.report({'ERROR'}, "Mesh has no UV map to sample with")
+                    return {'CANCELLED'}
+                colors, textured = face_texture_colors(mesh)
+                if not textured:
+                    self.report({'ERROR'}, "No material on this mesh has an image texture")
+                    return {'CANCELLED'}
+            else:
+                colors = face_attribute_colors(mesh)
+                if colors is None:
+                    self.report({'ERROR'}, "Mesh has no color attribute")
+                    return {'CANCELLED'}
+
+            if self.reference == 'ACTIVE':
+                active = mesh.polygons.active
+                if not 0 <= active < len(colors):
+                    self.report({'ERROR'}, "No active face")
+                    return {'CANCELLED'}
+                reference = colors[active]
+            else:
+                props = context.scene.face_color_material_props
+                reference = hex_to_rgb_float(props.hex_color) or tuple(props.color_picker)
+
+            distance = np.sqrt(((colors - np.asarray(reference, dtype=np.float32)) ** 2).sum(axis=1))
+            face_mask = distance <= self.threshold
+            if self.extend:
+                selected = np.zeros(len(mesh.polygons), dtype=bool)
+                mesh.polygons.foreach_get("select", selected)
+                face_mask |= selected
+            select_faces(mesh, face_mask)
+        finally:
+            bpy.ops.object.mode_set(mode='EDIT')
+
+        self.report({'INFO'}, f"Selected {int(face_mask.sum())} faces")
+        return {'FINISHED'}
+
+
+class FACECOLOR_OT_export_layout(bpy.types.Operator, ExportHelper):
+    bl_idname = "mesh.face_color_layout_export"
+    bl_label = "Export Face Colors"
+    bl_description = "Save the per-face materials by name, with a flat color palette as fallback"
+
+    filename_ext = ".npz"
+    filter_glob: StringProperty(default="*.npz", options={'HIDDEN'})
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Active object must be a mesh")
+            return {'CANCELLED'}
+
+        original_mode = obj.mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            count = save_face_layout(self.filepath, obj.data)
+        finally:
+            bpy.ops.object.mode_set(mode=original_mode)
+
+        self.report({'INFO'}, f"Saved {len(obj.data.polygons)} faces, {count} colors")
+        return {'FINISHED'}
+
+
+class FACECOLOR_OT_import_layout(bpy.types.Operator, ImportHelper):
+    bl_idname = "mesh.face_color_layout_import"
+    bl_label = "Import Face Colors"
+    bl_description = "Re-apply a saved face color layout to a mesh with the same topology"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filename_ext = ".npz"
+    filter_glob: StringProperty(default="*.npz", options={'HIDDEN'})
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Active object must be a mesh")
+            return {'CANCELLED'}
+
+        original_mode = obj.mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+        try:
+            fallback = load_face_layout(self.filepath, obj.data)
+            obj.data.update()
+        except (OSError, KeyError, ValueError) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        finally:
+            bpy.ops.object.mode_set(mode=original_mode)
+
+        self.report({'WARNING'} if fallback else {'INFO'},
+                    f"Applied layout to {len(obj.data.polygons)} faces, {fallback} with missing materials "
+                    f"got flat colors")
+        return {'FINISHED'}
+
+
 # --- Panel ---
 class FACECOLOR_PT_panel(bpy.types.Panel):
     bl_label = "Face Color Tool"
@@ -124,11 +718,29 @@ class FACECOLOR_PT_panel(bpy.types.Panel):
 
         layout.operator("mesh.face_apply_material_color", icon='MATERIAL')
 
+        layout.separator()
+        layout.label(text="Sample From Texture:")
+        layout.operator("mesh.face_sample_texture_colors", icon='IMAGE_DATA')
+
+        layout.separator()
+        layout.label(text="Select by Color:")
+        layout.operator("mesh.face_select_similar_color", icon='RESTRICT_SELECT_OFF')
+
+        layout.separator()
+        layout.label(text="Face Color Layout:")
+        row = layout.row(align=True)
+        row.operator("mesh.face_color_layout_export", text="Export", icon='EXPORT')
+        row.operator("mesh.face_color_layout_import", text="Import", icon='IMPORT')
+
 
 # --- Register ---
 classes = (
     FaceColorMaterialProps,
     FACECOLOR_OT_apply_material,
+    FACECOLOR_OT_sample_texture,
+    FACECOLOR_OT_select_similar_color,
+    FACECOLOR_OT_export_layout,
+    FACECOLOR_OT_import_layout,
     FACECOLOR_PT_panel,
 )
 
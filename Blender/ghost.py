@@ -9,7 +9,11 @@ bl_info = {
 }
 
 import bpy
-from bpy.props import FloatProperty, PointerProperty
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty, PointerProperty
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
 
 
 # ---------- Ghosting Logic ----------
@@ -19,6 +23,10 @@ def ghost_object(obj):
     obj.show_in_front = True   # Draw on top of other objects
     obj.display_type = 'TEXTURED' # was using "WIRE",  Optional: you can use 'SOLID' + transparency
 
+def ghost_occluder(obj):
+    obj.hide_select = True
+    obj.display_type = 'WIRE'  # See through to the object being edited
+
 def unghost_object(obj):
     obj.hide_select = False
     obj.show_in_front = False
@@ -76,6 +84,355 @@ def remove_transparency(obj):
         nodes["Principled BSDF"].inputs["Alpha"].default_value = 1.0
     mat.blend_method = 'OPAQUE'
 
+# Object color mode: alpha lives on the object, materials and shaders are untouched
+
+def set_object_color_alpha(obj, alpha):
+    obj.color[3] = alpha
+
+def use_object_color_shading(context, registry):
+    screen = context.screen
+    for index, area in enumerate(screen.areas):
+        if area.type == 'VIEW_3D':
+            for space in area.spaces:
+                if space.type == 'VIEW_3D' and space.shading.color_type != 'OBJECT':
+                    registry.record_shading(screen, index, space.shading.color_type)
+                    space.shading.color_type = 'OBJECT'
+
+
+# ---------- Ghost State Registry ----------
+# Struct-of-arrays snapshot of what ghosting and fading changed, stored on the
+# scene so restores survive save and reload. Rows are found by session_uid;
+# stored names are only used once after a load, when the uids are new.
+
+REGISTRY_PROP = "ghost_registry"
+_uid_scenes = set()  # session_uid of scenes whose stored uids belong to this session
+DISPLAY_TYPES = ('BOUNDS', 'WIRE', 'SOLID', 'TEXTURED')
+GHOSTED = 1
+FADED = 2
+AUTO = 4  # Ghosted by the occluder search, restored when no longer in the way
+
+OBJECT_FIELDS = (
+    ("flags", np.uint8),
+    ("hide_select", np.bool_),
+    ("show_in_front", np.bool_),
+    ("display_type", np.uint8),
+    ("color_alpha", np.float32),
+)
+
+def principled_alpha(mat):
+    if mat.use_nodes and "Principled BSDF" in mat.node_tree.nodes:
+        return mat.node_tree.nodes["Principled BSDF"].inputs["Alpha"].default_value
+    return 1.0
+
+def snapshot_fields(obj, flag):
+    """Current values of the registry fields that flag changes"""
+    fields = {}
+    if flag & GHOSTED:
+        fields["hide_select"] = obj.hide_select
+        fields["show_in_front"] = obj.show_in_front
+        fields["display_type"] = DISPLAY_TYPES.index(obj.display_type)
+    if flag & FADED:
+        fields["color_alpha"] = obj.color[3]
+    return fields
+
+@persistent
+def forget_registry_uids(dummy):
+    # Loaded registries carry the uids of the session that saved them
+    _uid_scenes.clear()
+
+class GhostRegistry:
+    def __init__(self, scene):
+        self.scene = scene
+        data = scene.get(REGISTRY_PROP) or {}
+
+        objects = data.get("objects", {})
+        self.names = list(objects.get("names", ()))
+        self.columns = {field: np.array(objects.get(field, ()), dtype=dtype) for field, dtype in OBJECT_FIELDS}
+        uids = objects.get("uids", ())
+        if scene.session_uid in _uid_scenes and len(uids) == len(self.names):
+            self.rows = {int(uid): row for row, uid in enumerate(uids)}
+        else:
+            by_name = {obj.name: obj for obj in bpy.data.objects} if self.names else {}
+            self.rows = {}
+            for row, name in enumerate(self.names):
+                obj = by_name.get(name)
+                if obj is not None:
+                    self.rows[obj.session_uid] = row
+
+        materials = data.get("materials", {})
+        self.materials = {
+            name: (blend, shadow, bool(back), float(alpha))
+            for name, blend, shadow, back, alpha in zip(
+                materials.get("names", ()), materials.get("blend_method", ()),
+                materials.get("shadow_method", ()), materials.get("show_transparent_back", ()),
+                materials.get("alpha", ()))
+        }
+
+        shading = data.get("shading", {})
+        self.shading = {
+            (screen, int(area)): color_type
+            for screen, area, color_type in zip(
+                shading.get("screens", ()), shading.get("areas", ()), shading.get("color_type", ()))
+        }
+
+    # Objects
+    def record(self, objs, flag):
+        """Snapshot what flag changes on objs and mark them with flag.
+
+        Rows that already carry flag keep their snapshot, so repeated calls
+        don't overwrite the original state.
+        """
+        flags = self.columns["flags"]
+        for obj in objs:
+            row = self.rows.get(obj.session_uid)
+            if row is None or (flags[row] & flag) == flag:
+                continue
+            # The row was made by the other flag: snapshot the fields this flag changes
+            for field, value in snapshot_fields(obj, flag & ~flags[row]).items():
+                self.columns[field][row] = value
+            flags[row] |= flag
+
+        new = [obj for obj in objs if obj.session_uid not in self.rows]
+        if not new:
+            return
+        values = {
+            "flags": [flag] * len(new),
+            "hide_select": [obj.hide_select for obj in new],
+            "show_in_front": [obj.show_in_front for obj in new],
+            "display_type": [DISPLAY_TYPES.index(obj.display_type) for obj in new],
+            "color_alpha": [obj.color[3] for obj in new],
+        }
+        for field, dtype in OBJECT_FIELDS:
+            self.columns[field] = np.concatenate((self.columns[field], np.array(values[field], dtype=dtype)))
+        for obj in new:
+            self.rows[obj.session_uid] = len(self.names)
+            self.names.append(obj.name)
+
+    def restore(self, objs, flag):
+        """Restore what flag changed on objs; returns the objects with no snapshot"""
+        missing = []
+        flags = self.columns["flags"]
+        for obj in objs:
+            row = self.rows.get(obj.session_uid)
+            if row is None or not flags[row] & flag:
+                missing.append(obj)
+                continue
+            if flag & GHOSTED:
+                obj.hide_select = bool(self.columns["hide_select"][row])
+                obj.show_in_front = bool(self.columns["show_in_front"][row])
+                obj.display_type = DISPLAY_TYPES[self.columns["display_type"][row]]
+            if flag & FADED:
+                obj.color[3] = float(self.columns["color_alpha"][row])
+            flags[row] &= ~np.uint8(flag)
+        self._drop_restored()
+        return missing
+
+    def unmark(self, objs, flag):
+        """Clear flag on objs without restoring anything"""
+        flags = self.columns["flags"]
+        for obj in objs:
+            row = self.rows.get(obj.session_uid)
+            if row is not None:
+                flags[row] &= ~np.uint8(flag)
+
+    def uids_with(self, flag):
+        flags = self.columns["flags"]
+        return {uid for uid, row in self.rows.items() if flags[row] & flag}
+
+    def _drop_restored(self):
+        self._keep_rows(self.columns["flags"] != 0)
+
+    def _keep_rows(self, keep):
+        if keep.all():
+            return
+        new_row = np.cumsum(keep) - 1
+        for field in self.columns:
+            self.columns[field] = self.columns[field][keep]
+        self.names = [name for name, k in zip(self.names, keep) if k]
+        self.rows = {uid: int(new_row[row]) for uid, row in self.rows.items() if keep[row]}
+
+    # Materials
+    def record_material(self, mat):
+        if mat.name not in self.materials:
+            self.materials[mat.name] = (mat.blend_method, getattr(mat, "shadow_method", ""),
+                                        mat.show_transparent_back, principled_alpha(mat))
+
+    def restore_material(self, mat):
+        state = self.materials.pop(mat.name, None)
+        if state is None:
+            return False
+        blend, shadow, back, alpha = state
+        mat.blend_method = blend
+        if shadow and hasattr(mat, "shadow_method"):
+            mat.shadow_method = shadow
+        mat.show_transparent_back = back
+        if mat.use_nodes and "Principled BSDF" in mat.node_tree.nodes:
+            mat.node_tree.nodes["Principled BSDF"].inputs["Alpha"].default_value = alpha
+        return True
+
+    # Viewport shading
+    def record_shading(self, screen, area_index, color_type):
+        self.shading.setdefault((screen.name, area_index), color_type)
+
+    def restore_shading(self):
+        """Put back the 3D view color types changed for faded objects"""
+        for (screen_name, area_index), color_type in self.shading.items():
+            screen = bpy.data.screens.get(screen_name)
+            if screen is None or area_index >= len(screen.areas):
+                continue
+            area = screen.areas[area_index]
+            if area.type == 'VIEW_3D' and area.spaces.active.shading.color_type == 'OBJECT':
+                area.spaces.active.shading.color_type = color_type
+        self.shading.clear()
+
+    def save(self):
+        # Drop rows of deleted objects and pick up renames since they were recorded
+        live = {obj.session_uid: obj.name for obj in bpy.data.objects} if self.names else {}
+        keep = np.zeros(len(self.names), dtype=bool)
+        for uid, row in self.rows.items():
+            if uid in live:
+                keep[row] = True
+                self.names[row] = live[uid]
+        self.rows = {uid: row for uid, row in self.rows.items() if uid in live}
+        self._keep_rows(keep)
+
+        uids = [0] * len(self.names)
+        for uid, row in self.rows.items():
+            uids[row] = uid
+        objects = {"names": self.names, "uids": uids}
+        for field, dtype in OBJECT_FIELDS:
+            objects[field] = self.columns[field].astype(np.float64 if dtype == np.float32 else np.int32).tolist()
+        materials = list(self.materials.items())
+        self.scene[REGISTRY_PROP] = {
+            "objects": objects,
+            "materials": {
+                "names": [name for name, _ in materials],
+                "blend_method": [state[0] for _, state in materials],
+                "shadow_method": [state[1] for _, state in materials],
+                "show_transparent_back": [int(state[2]) for _, state in materials],
+                "alpha": [state[3] for _, state in materials],
+            },
+            "shading": {
+                "screens": [screen for screen, _ in self.shading],
+                "areas": [area for _, area in self.shading],
+                "color_type": list(self.shading.values()),
+            },
+        }
+        _uid_scenes.add(self.scene.session_uid)
+
+
+# ---------- Occluder Search ----------
+# Local space BVH trees per object, dropped when the object's geometry changes.
+# Moving an object keeps its tree valid since rays are moved into local space.
+
+_bvh_cache = {}
+
+def get_bvh(obj, depsgraph):
+    tree = _bvh_cache.get(obj.session_uid)
+    if tree is None:
+        tree = BVHTree.FromObject(obj, depsgraph)
+        _bvh_cache[obj.session_uid] = tree
+    return tree
+
+@persistent
+def invalidate_bvh_cache(scene, depsgraph):
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            _bvh_cache.pop(update.id.original.session_uid, None)
+
+@persistent
+def clear_bvh_cache(dummy):
+    _bvh_cache.clear()
+
+def prune_bvh_cache():
+    """Drop trees of objects that were deleted since they were built"""
+    if _bvh_cache:
+        alive = {obj.session_uid for obj in bpy.data.objects}
+        for uid in [uid for uid in _bvh_cache if uid not in alive]:
+            del _bvh_cache[uid]
+
+def world_bounds(objs):
+    corners = np.empty((len(objs), 8, 3))
+    for i, obj in enumerate(objs):
+        matrix = np.array(obj.matrix_world)
+        corners[i] = np.array(obj.bound_box) @ matrix[:3, :3].T + matrix[:3, 3]
+    return corners.min(axis=1), corners.max(axis=1)
+
+def ray_hit_distance(obj, tree, origin, target):
+    """World distance from origin to the first hit on obj towards target, or None"""
+    inverse = obj.matrix_world.inverted()
+    local_origin = inverse @ origin
+    local_ray = inverse @ target - local_origin
+    location, _normal, _index, _distance = tree.ray_cast(local_origin, local_ray.normalized(), local_ray.length)
+    if location is None:
+        return None
+    return (obj.matrix_world @ location - origin).length
+
+def occlusion_rays(context, active, origin_mode, count):
+    """Ray origins and targets from the view or 3D cursor to points on the active object"""
+    rng = np.random.default_rng(0)
+    local = np.array(active.bound_box)
+    low, high = local.min(axis=0), local.max(axis=0)
+    samples = np.vstack(((low + high) * 0.5, rng.uniform(low, high, (count - 1, 3))))
+    targets = [active.matrix_world @ Vector(p) for p in samples]
+
+    rv3d = getattr(context.space_data, "region_3d", None)
+    if origin_mode == 'VIEW' and rv3d is not None:
+        view = rv3d.view_matrix.inverted()
+        if not rv3d.is_perspective:
+            # Orthographic views look along one direction, so every ray gets its own origin
+            back = view.to_3x3() @ Vector((0.0, 0.0, rv3d.view_distance * 10.0))
+            return [t + back for t in targets], targets
+        origin = view.translation
+    else:
+        origin = context.scene.cursor.location
+    return [origin.copy() for _ in targets], targets
+
+def find_occluders(context, active, origin_mode, count):
+    depsgraph = context.evaluated_depsgraph_get()
+    prune_bvh_cache()
+    origins, targets = occlusion_rays(context, active, origin_mode, count)
+
+    # Distance to the front surface of the active object along each ray
+    active_tree = get_bvh(active, depsgraph)
+    rays = []
+    for origin, target in zip(origins, targets):
+        far = origin + (target - origin) * 2.0
+        distance = ray_hit_distance(active, active_tree, origin, far)
+        if distance is not None:
+            rays.append((origin, (target - origin).normalized(), distance))
+    if not rays:
+        return []
+
+    candidates = [obj for obj in context.visible_objects if obj.type == 'MESH' and obj != active]
+    if not candidates:
+        return []
+
+    # Broad phase: slab test of every ray against every world bounding box at once
+    low, high = world_bounds(candidates)
+    ray_origin = np.array([r[0] for r in rays])[:, None, :]
+    ray_dir = np.array([r[1] for r in rays])[:, None, :]
+    ray_length = np.array([r[2] for r in rays])[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t0 = (low[None] - ray_origin) / ray_dir
+        t1 = (high[None] - ray_origin) / ray_dir
+    t_near = np.nan_to_num(np.minimum(t0, t1), nan=-np.inf).max(axis=2)
+    t_far = np.nan_to_num(np.maximum(t0, t1), nan=np.inf).min(axis=2)
+    hits = (t_near <= t_far) & (t_far >= 0.0) & (t_near < ray_length)
+
+    # Narrow phase: exact ray casts only for boxes the rays pass through
+    occluders = []
+    for index in np.flatnonzero(hits.any(axis=0)):
+        obj = candidates[index]
+        tree = get_bvh(obj, depsgraph)
+        for ray in np.flatnonzero(hits[:, index]):
+            origin, direction, length = rays[ray]
+            distance = ray_hit_distance(obj, tree, origin, origin + direction * length)
+            if distance is not None and distance < length:
+                occluders.append(obj)
+                break
+    return occluders
+
 
 # ---------- Operators ----------
 
@@ -87,9 +444,14 @@ class OBJECT_OT_ghost(bpy.types.Operator):
 
     def execute(self, context):
         objs = context.selected_objects if context.selected_objects else [context.active_object]
+        objs = [obj for obj in objs if obj is not None and obj.type == 'MESH']
+        registry = GhostRegistry(context.scene)
+        # Ghosting by hand takes over from the occluder search, which then leaves it alone
+        registry.unmark(objs, AUTO)
+        registry.record(objs, GHOSTED)
         for obj in objs:
-            if obj is not None and obj.type == 'MESH':
-                ghost_object(obj)
+            ghost_object(obj)
+        registry.save()
         return {'FINISHED'}
 
 class OBJECT_OT_unghost(bpy.types.Operator):
@@ -100,9 +462,12 @@ class OBJECT_OT_unghost(bpy.types.Operator):
 
     def execute(self, context):
         objs = context.selected_objects if context.selected_objects else [context.active_object]
-        for obj in objs:
-            if obj is not None and obj.type == 'MESH':
-                unghost_object(obj)
+        objs = [obj for obj in objs if obj is not None and obj.type == 'MESH']
+        registry = GhostRegistry(context.scene)
+        # Objects ghosted before the registry existed fall back to defaults
+        for obj in registry.restore(objs, GHOSTED | AUTO):
+            unghost_object(obj)
+        registry.save()
         return {'FINISHED'}
 
 
@@ -113,11 +478,22 @@ class OBJECT_OT_apply_transparency(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        alpha = context.scene.ghost_tool_props.transparency
+        props = context.scene.ghost_tool_props
+        alpha = props.transparency
         objs = context.selected_objects if context.selected_objects else [context.active_object]
-        for obj in objs:
-            if obj.type == 'MESH':
-                set_object_transparency(obj, alpha)
+        registry = GhostRegistry(context.scene)
+        if props.transparency_mode == 'OBJECT_COLOR':
+            objs = [obj for obj in objs if obj is not None]
+            use_object_color_shading(context, registry)
+            registry.record(objs, FADED)
+            for obj in objs:
+                set_object_color_alpha(obj, alpha)
+        else:
+            for obj in objs:
+                if obj.type == 'MESH':
+                    registry.record_material(ensure_material(obj))
+                    set_object_transparency(obj, alpha)
+        registry.save()
         return {'FINISHED'}
 
 class OBJECT_OT_remove_transparency(bpy.types.Operator):
@@ -128,9 +504,67 @@ class OBJECT_OT_remove_transparency(bpy.types.Operator):
 
     def execute(self, context):
         objs = context.selected_objects if context.selected_objects else [context.active_object]
-        for obj in objs:
-            if obj.type == 'MESH':
-                remove_transparency(obj)
+        registry = GhostRegistry(context.scene)
+        if context.scene.ghost_tool_props.transparency_mode == 'OBJECT_COLOR':
+            for obj in registry.restore([obj for obj in objs if obj is not None], FADED):
+                set_object_color_alpha(obj, 1.0)
+            # The viewports go back to their color type with the last faded object
+            if not registry.uids_with(FADED):
+                registry.restore_shading()
+        else:
+            for obj in objs:
+                if obj.type == 'MESH' and not registry.restore_material(ensure_material(obj)):
+                    remove_transparency(obj)
+        registry.save()
+        return {'FINISHED'}
+
+class OBJECT_OT_auto_ghost_occluders(bpy.types.Operator):
+    bl_idname = "object.auto_ghost_occluders"
+    bl_label = "Auto-Ghost Occluders"
+    bl_description = "Ghost the objects blocking the view of the active object and un-ghost those no longer in the way"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    origin: EnumProperty(
+        name="From",
+        items=[('VIEW', "View", "Cast rays from the viewpoint"),
+               ('CURSOR', "3D Cursor", "Cast rays from the 3D cursor")],
+        default='VIEW'
+    )
+    ray_count: IntProperty(
+        name="Rays",
+        description="Number of rays cast towards the active object",
+        default=32,
+        min=1,
+        max=512
+    )
+    clear: BoolProperty(
+        name="Clear",
+        description="Only restore the objects ghosted by earlier searches",
+        default=False
+    )
+
+    def execute(self, context):
+        active = context.active_object
+        if not self.clear and (active is None or active.type != 'MESH'):
+            self.report({'ERROR'}, "Active object must be a mesh")
+            return {'CANCELLED'}
+
+        occluders = [] if self.clear else find_occluders(context, active, self.origin, self.ray_count)
+        current = {obj.session_uid for obj in occluders}
+
+        registry = GhostRegistry(context.scene)
+        # Only rows the search ghosted itself are restored; manual ghosts are skipped
+        previous = registry.uids_with(AUTO)
+        registry.restore([obj for obj in context.scene.objects
+                          if obj.session_uid in previous and obj.session_uid not in current], GHOSTED | AUTO)
+        ghosted = registry.uids_with(GHOSTED)
+        new = [obj for obj in occluders if obj.session_uid not in ghosted]
+        registry.record(new, GHOSTED | AUTO)
+        for obj in new:
+            ghost_occluder(obj)
+        registry.save()
+
+        self.report({'INFO'}, f"{len(occluders)} occluders ghosted")
         return {'FINISHED'}
 
 
@@ -151,8 +585,15 @@ class GHOST_PT_panel(bpy.types.Panel):
         layout.operator("object.make_ghost", icon='HIDE_OFF')
         layout.operator("object.undo_ghost", icon='HIDE_ON')
 
+        layout.separator()
+        layout.label(text="Occluders of Active Object:")
+        row = layout.row(align=True)
+        row.operator("object.auto_ghost_occluders", text="Auto-Ghost", icon='VIS_SEL_11')
+        row.operator("object.auto_ghost_occluders", text="Clear", icon='X').clear = True
+
         layout.separator()
         layout.label(text="Transparency Control:")
+        layout.prop(props, "transparency_mode", text="")
         layout.prop(props, "transparency", text="Alpha")
         layout.operator("object.apply_transparency", icon='SHADING_TEXTURE')
         layout.operator("object.remove_transparency", icon='SHADING_SOLID')
@@ -169,6 +610,15 @@ class GhostToolProperties(bpy.types.PropertyGroup):
         max=1.0
     )
 
+    transparency_mode: EnumProperty(
+        name="Transparency Mode",
+        items=[
+            ('MATERIAL', "Material", "Edit the alpha of the object's first material (affects all its users)"),
+            ('OBJECT_COLOR', "Object Color", "Use the object color alpha with Object color shading; materials stay untouched"),
+        ],
+        default='MATERIAL'
+    )
+
 
 # ---------- Register ----------
 
@@ -178,6 +628,7 @@ classes = [
     OBJECT_OT_unghost,
     OBJECT_OT_apply_transparency,
     OBJECT_OT_remove_transparency,
+    OBJECT_OT_auto_ghost_occluders,
     GHOST_PT_panel,
 ]
 
@@ -185,8 +636,18 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.ghost_tool_props = PointerProperty(type=GhostToolProperties)
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_bvh_cache)
+    bpy.app.handlers.load_post.append(clear_bvh_cache)
+    bpy.app.handlers.load_post.append(forget_registry_uids)
 
 def unregister():
+    if invalidate_bvh_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_bvh_cache)
+    if clear_bvh_cache in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(clear_bvh_cache)
+    if forget_registry_uids in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(forget_registry_uids)
+    _bvh_cache.clear()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.ghost_tool_props
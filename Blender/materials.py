@@ -18,6 +18,18 @@ class MATERIALTOOLS_Properties(bpy.types.PropertyGroup):
         default="DuplicatedMaterial"
     )
 
+def set_mesh_materials(mesh, materials):
+    """Make the slot list of mesh match materials, reusing existing slots"""
+    slots = mesh.materials
+    # Trim or grow to the target length, then overwrite slots in place
+    while len(slots) > len(materials):
+        slots.pop()
+    for _ in range(len(materials) - len(slots)):
+        slots.append(None)
+    for i, mat in enumerate(materials):
+        if slots[i] != mat:
+            slots[i] = mat
+
 # Operator to copy materials from active to selected
 class MATERIALTOOLS_OT_copy_materials(bpy.types.Operator):
     bl_idname = "material.copy_materials"
@@ -32,12 +44,22 @@ class MATERIALTOOLS_OT_copy_materials(bpy.types.Operator):
             self.report({'WARNING'}, "Active object has no materials")
             return {'CANCELLED'}
 
-        for obj in selected:
-            if obj.type == 'MESH':
-                obj.data.materials.clear()
-                for mat in active.data.materials:
-                    obj.data.materials.append(mat)
-        self.report({'INFO'}, "Materials copied to selected objects")
+        source = list(active.data.materials)
+        source_mesh = active.data
+
+        # Many objects can share one mesh, so work per unique datablock
+        meshes = {obj.data for obj in selected
+                  if obj.type == 'MESH' and obj.data is not source_mesh}
+
+        touched = 0
+        for mesh in meshes:
+            if list(mesh.materials) == source:
+                continue
+            set_mesh_materials(mesh, source)
+            touched += 1
+
+        self.report({'INFO'}, f"Materials copied to {touched} mesh(es), "
+                              f"{len(meshes) - touched} already matched")
         return {'FINISHED'}
 
 # Operator to duplicate active material
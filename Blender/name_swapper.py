@@ -1,14 +1,85 @@
 bl_info = {
     "name": "Swap Names of Outliner Selections",
     "author": "ChatGPT",
-    "version": (1, 3),
+    "version": (1, 4),
     "blender": (3, 0, 0),
     "location": "Outliner > Right Click Menu",
-    "description": "Swaps names of exactly two selected datablocks in Outliner (objects, collections, etc.)",
+    "description": "Swaps names of two selected datablocks in Outliner, or batch rotates, reverses and regex-renames many",
     "category": "Interface",
 }
 
 import bpy
+import re
+
+
+def plan_renames(current, targets, taken):
+    """Order renames so that no step ever collides with a name in use.
+
+    current and targets are parallel name lists, taken holds the names of the
+    other IDs in the same namespace. Every item holds one name and wants one,
+    so the renames form chains and cycles: chains run from their free end,
+    each cycle is broken with a single temporary name. Returns the steps as
+    (item index, new name) pairs and the number of temporary names used.
+    """
+    if len(set(targets)) != len(targets):
+        raise ValueError("Several items would get the same name")
+    clashes = sorted(set(targets) & set(taken))
+    if clashes:
+        raise ValueError(f"Names already used by other data: {', '.join(clashes[:5])}")
+
+    owner = {name: i for i, name in enumerate(current)}
+    holder = [owner.get(target) for target in targets]
+    waiting = {j: i for i, j in enumerate(holder) if j is not None and j != i}
+    done = [target == name for name, target in zip(current, targets)]
+    steps = []
+
+    def unwind(i):
+        # Everyone waiting on a freed name can move, one after another
+        while i is not None and not done[i]:
+            steps.append((i, targets[i]))
+            done[i] = True
+            i = waiting.get(i)
+
+    for i, j in enumerate(holder):
+        if j is None:
+            unwind(i)
+
+    in_use = set(current) | set(targets) | set(taken)
+    temp_count = 0
+    for i in range(len(current)):
+        if done[i]:
+            continue
+        temp = f"__rename_tmp_{temp_count}__"
+        while temp in in_use:
+            temp = "_" + temp
+        in_use.add(temp)
+        temp_count += 1
+        steps.append((i, temp))
+        done[i] = True
+        unwind(waiting.get(i))
+        steps.append((i, targets[i]))
+    return steps, temp_count
+
+
+def id_collection(item):
+    """The bpy.data collection holding item, whose names share one namespace"""
+    for prop in bpy.data.bl_rna.properties:
+        if prop.type != 'COLLECTION':
+            continue
+        item_type = getattr(bpy.types, prop.fixed_type.identifier, None)
+        if item_type is not None and item_type is not bpy.types.ID and isinstance(item, item_type):
+            return getattr(bpy.data, prop.identifier)
+    return None
+
+
+def taken_names(id_type, items):
+    collection = id_collection(items[0])
+    if collection is None:
+        # Without the other names no rename order can be promised collision-free
+        raise ValueError(f"Cannot check {id_type} names for collisions")
+    own = {item.name for item in items}
+    return {data.name for data in collection if data.library is None and data.name not in own}
+
 
 class OUTLINER_OT_swap_names(bpy.types.Operator):
     bl_idname = "outliner.swap_names"
@@ -38,6 +109,102 @@ class OUTLINER_OT_swap_names(bpy.types.Operator):
         self.report({'INFO'}, f"Swapped names: {name1} <--> {name2}")
         return {'FINISHED'}
 
+class OUTLINER_OT_batch_rename(bpy.types.Operator):
+    bl_idname = "outliner.batch_rename_plan"
+    bl_label = "Batch Rename Selected Items"
+    bl_description = "Rotate, reverse or regex-rename the selected datablocks in a collision-free order"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[('ROTATE', "Rotate", "Shift names along the selection sorted by name"),
+               ('REVERSE', "Reverse", "Reverse the order of names in the selection"),
+               ('REGEX', "Regex", "Replace a regular expression in each name")],
+        default='ROTATE'
+    )
+    offset: bpy.props.IntProperty(name="Offset", default=1)
+    pattern: bpy.props.StringProperty(name="Pattern", default="")
+    replacement: bpy.props.StringProperty(name="Replacement", default="")
+    dry_run: bpy.props.BoolProperty(
+        name="Dry Run",
+        description="Only print the planned renames to the console",
+        default=False
+    )
+
+    def selected_items(self, context):
+        ids = getattr(context, "selected_ids", None) or context.selected_objects
+        return [item for item in ids if hasattr(item, "name") and getattr(item, "library", None) is None]
+
+    def new_names(self, names):
+        if self.mode == 'ROTATE':
+            ordered = sorted(range(len(names)), key=lambda i: names[i])
+            targets = list(names)
+            for position, i in enumerate(ordered):
+                targets[i] = names[ordered[(position + self.offset) % len(ordered)]]
+            return targets
+        if self.mode == 'REVERSE':
+            ordered = sorted(range(len(names)), key=lambda i: names[i])
+            targets = list(names)
+            for i, j in zip(ordered, reversed(ordered)):
+                targets[i] = names[j]
+            return targets
+        return [re.sub(self.pattern, self.replacement, name) for name in names]
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        items = self.selected_items(context)
+        if not items:
+            self.report({'WARNING'}, "Nothing selected to rename.")
+            return {'CANCELLED'}
+
+        # IDs of different types do not share names, plan each type separately
+        groups = {}
+        for item in items:
+            groups.setdefault(getattr(item, "id_type", type(item).__name__), []).append(item)
+
+        plans = []
+        try:
+            for id_type, group in groups.items():
+                names = [item.name for item in group]
+                targets = self.new_names(names)
+                if any(not name for name in targets):
+                    raise ValueError("A rename would produce an empty name")
+                steps, temp_count = plan_renames(names, targets, taken_names(id_type, group))
+                plans.append((group, steps, temp_count))
+        except (ValueError, re.error) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+
+        temps = sum(temp_count for _, _, temp_count in plans)
+
+        if self.dry_run:
+            for group, steps, _ in plans:
+                names = [item.name for item in group]
+                for i, name in steps:
+                    print(f"{names[i]!r} -> {name!r}")
+                    names[i] = name
+            self.report({'INFO'}, f"Dry run: {len(items)} items, {sum(len(s) for _, s, _ in plans)} renames, {temps} temporary names (see console)")
+            return {'FINISHED'}
+
+        for group, steps, _ in plans:
+            for i, name in steps:
+                group[i].name = name
+
+        self.report({'INFO'}, f"Renamed {len(items)} items using {temps} temporary names")
+        return {'FINISHED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "mode")
+        if self.mode == 'ROTATE':
+            layout.prop(self, "offset")
+        elif self.mode == 'REGEX':
+            layout.prop(self, "pattern")
+            layout.prop(self, "replacement")
+        layout.prop(self, "dry_run")
+
 class OUTLINER_PT_swap_names_panel(bpy.types.Panel):
     bl_label = "Outliner Tools"
     bl_idname = "OUTLINER_PT_swap_names_panel"
@@ -48,20 +215,24 @@ class OUTLINER_PT_swap_names_panel(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         layout.operator(OUTLINER_OT_swap_names.bl_idname)
+        layout.operator(OUTLINER_OT_batch_rename.bl_idname)
 
 
 def menu_func(self, context):
     if OUTLINER_OT_swap_names.poll(context):
         self.layout.operator(OUTLINER_OT_swap_names.bl_idname, icon='SORTALPHA')
+    self.layout.operator(OUTLINER_OT_batch_rename.bl_idname, icon='SORTALPHA')
 
 def register():
     bpy.utils.register_class(OUTLINER_OT_swap_names)
+    bpy.utils.register_class(OUTLINER_OT_batch_rename)
     bpy.utils.register_class(OUTLINER_PT_swap_names_panel)
     bpy.types.OUTLINER_MT_context_menu.append(menu_func)
 
 def unregister():
     bpy.types.OUTLINER_MT_context_menu.remove(menu_func)
     bpy.utils.unregister_class(OUTLINER_PT_swap_names_panel)
+    bpy.utils.unregister_class(OUTLINER_OT_batch_rename)
     bpy.utils.unregister_class(OUTLINER_OT_swap_names)
 
 
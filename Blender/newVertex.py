@@ -10,11 +10,199 @@ bl_info = {
 
 import bpy
 import bmesh
+import numpy as np
 from bpy.props import CollectionProperty, FloatVectorProperty
-from bpy.props import FloatProperty
-
-# Global buffer for copied vertex positions
-copied_vertex_positions = []
+from bpy.props import FloatProperty, EnumProperty, StringProperty
+from bpy_extras import view3d_utils
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from mathutils.kdtree import KDTree
+import gpu
+from gpu_extras.batch import batch_for_shader
+
+
+class VertexClipboard:
+    """Selected vertices with the edges and faces between them, as flat arrays"""
+
+    def __init__(self):
+        self.co = np.empty((0, 3), dtype=np.float32)
+        self.edges = np.empty((0, 2), dtype=np.int32)
+        self.face_sizes = np.empty(0, dtype=np.int32)
+        self.face_verts = np.empty(0, dtype=np.int32)
+        self.matrix = np.identity(4)
+
+    def __len__(self):
+        return len(self.co)
+
+    def capture(self, obj):
+        obj.update_from_editmode()
+        mesh = obj.data
+        selected = np.zeros(len(mesh.vertices), dtype=bool)
+        mesh.vertices.foreach_get("select", selected)
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+
+        # Old vertex index -> clipboard index
+        remap = np.full(len(mesh.vertices), -1, dtype=np.int32)
+        remap[selected] = np.arange(int(selected.sum()), dtype=np.int32)
+
+        edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        edges = edges.reshape(-1, 2)
+        edges = edges[selected[edges].all(axis=1)]
+
+        starts = np.empty(len(mesh.polygons), dtype=np.int32)
+        sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", starts)
+        mesh.polygons.foreach_get("loop_total", sizes)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        if len(starts):
+            whole = np.logical_and.reduceat(selected[loop_verts], starts)
+            loop_mask = np.repeat(whole, sizes)
+        else:
+            whole = np.zeros(0, dtype=bool)
+            loop_mask = np.zeros(0, dtype=bool)
+
+        self.co = co.reshape(-1, 3)[selected]
+        self.edges = remap[edges]
+        self.face_sizes = sizes[whole]
+        self.face_verts = remap[loop_verts[loop_mask]]
+        self.matrix = np.array(obj.matrix_world)
+
+    def positions(self, target, space):
+        if space == 'WORLD':
+            # Keep world placement: source object space -> world -> target object space
+            matrix = np.linalg.inv(np.array(target.matrix_world)) @ self.matrix
+            return self.co @ matrix[:3, :3].T.astype(np.float32) + matrix[:3, 3].astype(np.float32)
+        return self.co
+
+    def build_mesh(self, co):
+        """Temporary mesh holding the clipboard, built with bulk writes"""
+        mesh = bpy.data.meshes.new("__vertex_clipboard__")
+        mesh.vertices.add(len(co))
+        mesh.vertices.foreach_set("co", co.ravel())
+        mesh.edges.add(len(self.edges))
+        mesh.edges.foreach_set("vertices", self.edges.ravel())
+        mesh.loops.add(len(self.face_verts))
+        mesh.loops.foreach_set("vertex_index", self.face_verts)
+        mesh.polygons.add(len(self.face_sizes))
+        starts = np.zeros(len(self.face_sizes), dtype=np.int32)
+        np.cumsum(self.face_sizes[:-1], out=starts[1:])
+        mesh.polygons.foreach_set("loop_start", starts)
+        try:
+            mesh.polygons.foreach_set("loop_total", self.face_sizes)
+        except (AttributeError, TypeError):
+            pass  # Derived from loop_start in newer Blender versions
+        mesh.update(calc_edges=True)
+        for elements in (mesh.vertices, mesh.edges, mesh.polygons):
+            elements.foreach_set("select", np.ones(len(elements), dtype=bool))
+        return mesh
+
+    def save(self, filepath):
+        np.savez_compressed(filepath, co=self.co, edges=self.edges, face_sizes=self.face_sizes,
+                            face_verts=self.face_verts, matrix=self.matrix)
+
+    def load(self, filepath):
+        with np.load(filepath) as data:
+            self.co = data["co"].astype(np.float32)
+            self.edges = data["edges"].astype(np.int32)
+            self.face_sizes = data["face_sizes"].astype(np.int32)
+            self.face_verts = data["face_verts"].astype(np.int32)
+            self.matrix = data["matrix"]
+
+
+# Global vertex clipboard
+vertex_clipboard = VertexClipboard()
+
+
+# Selected vertex transforms: read once, edit in NumPy, write back once.
+# Small selections go straight into the edit BMesh, large ones through a
+# single object mode bulk write.
+BMESH_WRITE_LIMIT = 50000
+AXIS_INDICES = {'X': [0], 'Y': [1], 'Z': [2], 'XYZ': [0, 1, 2]}
+
+# Selected vertex indices per mesh pointer, with a stamp of the edit mesh.
+# A hit only has to confirm the cached vertices are still selected, so
+# repeated clicks on one selection skip the scan over every vertex.
+_selection_cache = {}
+
+def selection_stamp(mesh, bm):
+    return (len(bm.verts), len(bm.edges), len(bm.faces), mesh.total_vert_sel)
+
+def remember_selection(obj, bm, indices):
+    _selection_cache[obj.data.as_pointer()] = (selection_stamp(obj.data, bm), np.asarray(indices, dtype=np.int64))
+
+def selected_vertex_indices(obj, bm):
+    mesh = obj.data
+    stamp = selection_stamp(mesh, bm)
+    cached = _selection_cache.get(mesh.as_pointer())
+    if cached and cached[0] == stamp and len(cached[1]) <= BMESH_WRITE_LIMIT:
+        bm.verts.ensure_lookup_table()
+        verts = bm.verts
+        # Same count and all still selected means the same selection
+        if all(verts[i].select for i in cached[1].tolist()):
+            return cached[1]
+
+    obj.update_from_editmode()
+    selected = np.zeros(len(mesh.vertices), dtype=bool)
+    mesh.vertices.foreach_get("select", selected)
+    indices = np.flatnonzero(selected)
+    _selection_cache[mesh.as_pointer()] = (stamp, indices)
+    return indices
+
+def transform_selected(obj, transform, exclude=-1):
+    """Replace the selected vertex positions co with transform(co), an (N, 3) array.
+
+    Small selections are edited in the edit BMesh. Large ones take a single
+    object mode round trip, reading the selection and every coordinate from
+    that one conversion. Returns the number of vertices transformed.
+    """
+    mesh = obj.data
+    if mesh.total_vert_sel <= BMESH_WRITE_LIMIT:
+        bm = bmesh.from_edit_mesh(mesh)
+        indices = selected_vertex_indices(obj, bm)
+        indices = indices[indices != exclude]
+        bm.verts.ensure_lookup_table()
+        verts = bm.verts
+        co = np.array([verts[i].co for i in indices.tolist()], dtype=np.float32).reshape(-1, 3)
+        for i, position in zip(indices.tolist(), transform(co).tolist()):
+            verts[i].co = position
+        bmesh.update_edit_mesh(mesh)
+        return len(indices)
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    try:
+        selected = np.zeros(len(mesh.vertices), dtype=bool)
+        mesh.vertices.foreach_get("select", selected)
+        if exclude >= 0:
+            selected[exclude] = False
+        indices = np.flatnonzero(selected)
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3)
+        co[indices] = transform(co[indices])
+        mesh.vertices.foreach_set("co", co.ravel())
+        mesh.update()
+    finally:
+        bpy.ops.object.mode_set(mode='EDIT')
+    return len(indices)
+
+def transform_coords(co, mode, axis, value, pivot=None):
+    """Move, set, align, quantize or scale an (N, 3) array along the given axes"""
+    co = co.copy()
+    axes = AXIS_INDICES[axis]
+    if mode == 'MOVE':
+        co[:, axes] += value
+    elif mode == 'SET':
+        co[:, axes] = value
+    elif mode == 'ALIGN':
+        co[:, axes] = co[:, axes].mean(axis=0)
+    elif mode == 'QUANTIZE' and value > 0.0:
+        co[:, axes] = np.round(co[:, axes] / value) * value
+    elif mode == 'SCALE':
+        center = co.mean(axis=0) if pivot is None else np.asarray(pivot, dtype=np.float32)
+        co[:, axes] = center[axes] + (co[:, axes] - center[axes]) * value
+    return co
 
 class EDITVERTEX_OT_add_vertex_cursor(bpy.types.Operator):
     bl_idname = "mesh.add_vertex_at_cursor"
@@ -27,6 +215,9 @@ class EDITVERTEX_OT_add_vertex_cursor(bpy.types.Operator):
             self.report({'ERROR'}, "You must be in Edit Mode on a mesh object")
             return {'CANCELLED'}
 
+        # Deselect all in one call, select new vertex
+        bpy.ops.mesh.select_all(action='DESELECT')
+
         bm = bmesh.from_edit_mesh(obj.data)
         # Get cursor location in local space
         cursor_world = context.scene.cursor.location
@@ -37,14 +228,12 @@ class EDITVERTEX_OT_add_vertex_cursor(bpy.types.Operator):
         bm.verts.index_update()
         bm.verts.ensure_lookup_table()
 
-        # Deselect all, select new vertex
-        for v in bm.verts:
-            v.select = False
         new_vert.select = True
         bm.select_history.clear()
         bm.select_history.add(new_vert)
 
         bmesh.update_edit_mesh(obj.data)
+        remember_selection(obj, bm, [new_vert.index])
 
         # Change to Move tool
         context.workspace.tools.from_space_view3d_mode(bpy.context.mode, create=True).idname = 'builtin.move'
@@ -54,55 +243,91 @@ class EDITVERTEX_OT_add_vertex_cursor(bpy.types.Operator):
 class EDITVERTEX_OT_copy_vertices(bpy.types.Operator):
     bl_idname = "mesh.copy_selected_vertices"
     bl_label = "Copy Selected Vertices"
-    bl_description = "Copy positions of selected vertices"
+    bl_description = "Copy selected vertices with the edges and faces between them"
 
     def execute(self, context):
-        global copied_vertex_positions
-        copied_vertex_positions.clear()
-
         obj = context.edit_object
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "You must be in Edit Mode on a mesh object")
+            return {'CANCELLED'}
 
-        for v in bm.verts:
-            if v.select:
-                copied_vertex_positions.append(v.co.copy())
+        vertex_clipboard.capture(obj)
 
-        self.report({'INFO'}, f"Copied {len(copied_vertex_positions)} vertices")
+        self.report({'INFO'}, f"Copied {len(vertex_clipboard)} vertices, "
+                              f"{len(vertex_clipboard.edges)} edges, {len(vertex_clipboard.face_sizes)} faces")
         return {'FINISHED'}
 
 class EDITVERTEX_OT_paste_vertices(bpy.types.Operator):
     bl_idname = "mesh.paste_copied_vertices"
     bl_label = "Paste Copied Vertices"
-    bl_description = "Paste copied vertices as new ones"
+    bl_description = "Paste copied vertices, edges and faces as new geometry"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    space: EnumProperty(
+        name="Space",
+        items=[('LOCAL', "Local", "Reuse the copied local coordinates"),
+               ('WORLD', "World", "Keep the copied world positions")],
+        default='LOCAL'
+    )
 
     def execute(self, context):
-        global copied_vertex_positions
-        if not copied_vertex_positions:
+        if not len(vertex_clipboard):
             self.report({'WARNING'}, "No vertices copied")
             return {'CANCELLED'}
 
         obj = context.edit_object
-        bm = bmesh.from_edit_mesh(obj.data)
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "You must be in Edit Mode on a mesh object")
+            return {'CANCELLED'}
 
-        # Deselect all first
-        for v in bm.verts:
-            v.select = False
+        bpy.ops.mesh.select_all(action='DESELECT')
+        bm = bmesh.from_edit_mesh(obj.data)
 
-        new_verts = []
-        for pos in copied_vertex_positions:
-            v = bm.verts.new(pos)
-            v.select = True
-            new_verts.append(v)
+        # Appending one prebuilt mesh replaces a verts.new call per vertex
+        temp_mesh = vertex_clipboard.build_mesh(vertex_clipboard.positions(obj, self.space))
+        bm.from_mesh(temp_mesh)
+        bpy.data.meshes.remove(temp_mesh)
 
         bm.verts.index_update()
         bm.select_history.clear()
-        for v in new_verts:
-            bm.select_history.add(v)
+        bm.select_flush(True)
 
         bmesh.update_edit_mesh(obj.data)
         context.workspace.tools.from_space_view3d_mode(bpy.context.mode, create=True).idname = 'builtin.move'
-        self.report({'INFO'}, f"Pasted {len(new_verts)} vertices")
+        self.report({'INFO'}, f"Pasted {len(vertex_clipboard)} vertices")
+        return {'FINISHED'}
+
+class EDITVERTEX_OT_save_clipboard(bpy.types.Operator, ExportHelper):
+    bl_idname = "mesh.save_vertex_clipboard"
+    bl_label = "Save Vertex Clipboard"
+    bl_description = "Write the copied vertices, edges and faces to a .npz file"
+
+    filename_ext = ".npz"
+    filter_glob: StringProperty(default="*.npz", options={'HIDDEN'})
+
+    def execute(self, context):
+        if not len(vertex_clipboard):
+            self.report({'WARNING'}, "No vertices copied")
+            return {'CANCELLED'}
+        vertex_clipboard.save(self.filepath)
+        self.report({'INFO'}, f"Saved {len(vertex_clipboard)} vertices")
+        return {'FINISHED'}
+
+class EDITVERTEX_OT_load_clipboard(bpy.types.Operator, ImportHelper):
+    bl_idname = "mesh.load_vertex_clipboard"
+    bl_label = "Load Vertex Clipboard"
+    bl_description = "Read a vertex clipboard .npz file for pasting"
+
+    filename_ext = ".npz"
+    filter_glob: StringProperty(default="*.npz", options={'HIDDEN'})
+
+    def execute(self, context):
+        try:
+            vertex_clipboard.load(self.filepath)
+        except (OSError, KeyError, ValueError) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Loaded {len(vertex_clipboard)} vertices")
         return {'FINISHED'}
 
 class EDITVERTEX_OT_move_selected_axis(bpy.types.Operator):
@@ -124,21 +349,9 @@ class EDITVERTEX_OT_move_selected_axis(bpy.types.Operator):
             self.report({'ERROR'}, "Edit Mode required on a mesh")
             return {'CANCELLED'}
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-
         amount = context.scene.edit_vertex_move_amount
 
-        for v in bm.verts:
-            if v.select:
-                if self.axis == 'X':
-                    v.co.x += amount
-                elif self.axis == 'Y':
-                    v.co.y += amount
-                elif self.axis == 'Z':
-                    v.co.z += amount
-
-        bmesh.update_edit_mesh(obj.data)
+        transform_selected(obj, lambda co: transform_coords(co, 'MOVE', self.axis, amount))
         return {'FINISHED'}
 
 class EDITVERTEX_OT_connect_vertex_cursor(bpy.types.Operator):
@@ -153,14 +366,15 @@ class EDITVERTEX_OT_connect_vertex_cursor(bpy.types.Operator):
             return {'CANCELLED'}
 
         bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-
-        selected_verts = [v for v in bm.verts if v.select]
-        if len(selected_verts) != 1:
+        selected = selected_vertex_indices(obj, bm)
+        if len(selected) != 1:
             self.report({'WARNING'}, "Please select exactly one vertex to connect from")
             return {'CANCELLED'}
 
-        from_vert = selected_verts[0]
+        bpy.ops.mesh.select_all(action='DESELECT')
+        bm = bmesh.from_edit_mesh(obj.data)
+        bm.verts.ensure_lookup_table()
+        from_vert = bm.verts[int(selected[0])]
 
         # Convert 3D cursor to local space
         cursor_world = context.scene.cursor.location
@@ -171,18 +385,173 @@ class EDITVERTEX_OT_connect_vertex_cursor(bpy.types.Operator):
         bm.edges.new([from_vert, new_vert])
 
         # Update selection
-        for v in bm.verts:
-            v.select = False
         new_vert.select = True
         bm.select_history.clear()
         bm.select_history.add(new_vert)
+        bm.verts.index_update()
 
         bmesh.update_edit_mesh(obj.data)
+        remember_selection(obj, bm, [new_vert.index])
         context.workspace.tools.from_space_view3d_mode(bpy.context.mode, create=True).idname = 'builtin.move'
 
         self.report({'INFO'}, "Vertex created and connected")
         return {'FINISHED'}
 
+# Snapping KD-trees per mesh, rebuilt only when the vertex coordinates change
+_kdtree_cache = {}
+
+def get_vertex_kdtree(obj):
+    """World space KD-tree over the mesh vertices, with world coordinates"""
+    obj.update_from_editmode()
+    mesh = obj.data
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    matrix = np.array(obj.matrix_world)
+    co = co.reshape(-1, 3) @ matrix[:3, :3].T.astype(np.float32) + matrix[:3, 3].astype(np.float32)
+
+    stamp = (len(co), float(co.sum()), float(np.abs(co).sum()))
+    cached = _kdtree_cache.get(mesh.as_pointer())
+    if cached and cached[0] == stamp:
+        return cached[1]
+    tree = KDTree(len(co))
+    for i, position in enumerate(co.tolist()):
+        tree.insert(position, i)
+    tree.balance()
+    _kdtree_cache[mesh.as_pointer()] = (stamp, tree)
+    return tree
+
+def polyline_shader():
+    try:
+        return gpu.shader.from_builtin('UNIFORM_COLOR')
+    except ValueError:
+        return gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+
+class EDITVERTEX_OT_draw_polyline(bpy.types.Operator):
+    bl_idname = "mesh.draw_polyline_at_clicks"
+    bl_label = "Draw Connected Vertices"
+    bl_description = "Click to add connected vertices on the 3D cursor plane; Enter/Right click to confirm, Esc to cancel"
+    # Snapping is resolved per click, so there is nothing for a redo panel to re-run
+    bl_options = {'UNDO'}
+
+    snap: bpy.props.BoolProperty(name="Snap to Vertices", default=True)
+    snap_distance: FloatProperty(name="Snap Distance", default=0.05, min=0.0, precision=3)
+
+    @classmethod
+    def poll(cls, context):
+        return context.edit_object is not None and context.area is not None and context.area.type == 'VIEW_3D'
+
+    def invoke(self, context, event):
+        obj = context.edit_object
+        if obj.type != 'MESH':
+            self.report({'ERROR'}, "You must be in Edit Mode on a mesh object")
+            return {'CANCELLED'}
+
+        bm = bmesh.from_edit_mesh(obj.data)
+        selected = selected_vertex_indices(obj, bm)
+        self.start_index = int(selected[0]) if len(selected) == 1 else -1
+        # Invoked from the sidebar the context region is the UI, clicks land in the main region
+        self.region = next(r for r in context.area.regions if r.type == 'WINDOW')
+        self.rv3d = context.space_data.region_3d
+        self.tree = get_vertex_kdtree(obj) if self.snap else None
+
+        # Clicked points in world space, and the existing vertex each snapped to (-1 for new)
+        self.points = []
+        self.snapped = []
+        self.hover = None
+
+        self.shader = polyline_shader()
+        self.draw_handle = bpy.types.SpaceView3D.draw_handler_add(self.draw_preview, (), 'WINDOW', 'POST_VIEW')
+        context.window_manager.modal_handler_add(self)
+        context.workspace.status_text_set("Click: add vertex | Enter / Right click: confirm | Backspace: undo point | Esc: cancel")
+        return {'RUNNING_MODAL'}
+
+    def in_region(self, event):
+        region = self.region
+        return (region.x <= event.mouse_x < region.x + region.width and
+                region.y <= event.mouse_y < region.y + region.height)
+
+    def mouse_point(self, context, event):
+        coord = (event.mouse_x - self.region.x, event.mouse_y - self.region.y)
+        point = view3d_utils.region_2d_to_location_3d(self.region, self.rv3d, coord,
+                                                      context.scene.cursor.location)
+        if self.tree is not None:
+            location, index, distance = self.tree.find(point)
+            if index is not None and distance <= self.snap_distance:
+                return location, index
+        return point, -1
+
+    def draw_preview(self):
+        points = [tuple(p) for p in self.points]
+        if self.hover is not None:
+            points.append(tuple(self.hover))
+        if len(points) < 2:
+            return
+        batch = batch_for_shader(self.shader, 'LINE_STRIP', {"pos": points})
+        self.shader.bind()
+        self.shader.uniform_float("color", (1.0, 0.6, 0.1, 1.0))
+        batch.draw(self.shader)
+
+    def finish(self, context):
+        bpy.types.SpaceView3D.draw_handler_remove(self.draw_handle, 'WINDOW')
+        context.workspace.status_text_set(None)
+        context.area.tag_redraw()
+
+    def modal(self, context, event):
+        context.area.tag_redraw()
+        if event.type == 'MOUSEMOVE':
+            self.hover = self.mouse_point(context, event)[0] if self.in_region(event) else None
+        elif event.type == 'LEFTMOUSE' and event.value == 'PRESS':
+            if not self.in_region(event):
+                return {'PASS_THROUGH'}
+            point, index = self.mouse_point(context, event)
+            if not self.snapped or index < 0 or self.snapped[-1] != index:
+                self.points.append(point.copy())
+                self.snapped.append(index)
+        elif event.type == 'BACK_SPACE' and event.value == 'PRESS' and self.points:
+            self.points.pop()
+            self.snapped.pop()
+        elif event.type in {'RET', 'NUMPAD_ENTER', 'RIGHTMOUSE'} and event.value == 'PRESS':
+            self.finish(context)
+            return self.build(context)
+        elif event.type == 'ESC':
+            self.finish(context)
+            return {'CANCELLED'}
+        elif event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            return {'PASS_THROUGH'}
+        return {'RUNNING_MODAL'}
+
+    def build(self, context):
+        if not self.points:
+            return {'CANCELLED'}
+
+        obj = context.edit_object
+        inverse = np.linalg.inv(np.array(obj.matrix_world))
+        world = np.array([tuple(p) for p in self.points])
+        local = world @ inverse[:3, :3].T + inverse[:3, 3]
+
+        bpy.ops.mesh.select_all(action='DESELECT')
+        bm = bmesh.from_edit_mesh(obj.data)
+        bm.verts.ensure_lookup_table()
+
+        chain = [bm.verts[self.start_index]] if self.start_index >= 0 else []
+        for position, index in zip(local.tolist(), self.snapped):
+            chain.append(bm.verts[index] if index >= 0 else bm.verts.new(position))
+        for a, b in zip(chain, chain[1:]):
+            if a != b and bm.edges.get((a, b)) is None:
+                bm.edges.new((a, b))
+
+        last = chain[-1]
+        last.select = True
+        bm.select_history.clear()
+        bm.select_history.add(last)
+        bm.verts.index_update()
+
+        # One mesh update and one undo step for the whole polyline
+        bmesh.update_edit_mesh(obj.data)
+        remember_selection(obj, bm, [last.index])
+        self.report({'INFO'}, f"Added {len(self.points)} connected vertices")
+        return {'FINISHED'}
+
 class EDITVERTEX_OT_snap_axis_from_first(bpy.types.Operator):
     bl_idname = "mesh.snap_axis_from_first"
     bl_label = "Snap Axis to First Selected"
@@ -213,19 +582,70 @@ class EDITVERTEX_OT_snap_axis_from_first(bpy.types.Operator):
             self.report({'WARNING'}, "No vertex selection history found")
             return {'CANCELLED'}
 
-        source_vert = history[0]
-        source_value = getattr(source_vert.co, self.axis.lower())
+        bm.verts.index_update()
+        source_index = history[0].index
+        source_value = float(history[0].co[AXIS_INDICES[self.axis][0]])
 
-        count = 0
-        for v in bm.verts:
-            if v.select and v != source_vert:
-                setattr(v.co, self.axis.lower(), source_value)
-                count += 1
+        count = transform_selected(obj, lambda co: transform_coords(co, 'SET', self.axis, source_value),
+                                   exclude=source_index)
 
-        bmesh.update_edit_mesh(obj.data)
         self.report({'INFO'}, f"Snapped {count} vertices to {self.axis} = {source_value:.3f}")
         return {'FINISHED'}
 
+class EDITVERTEX_OT_transform_selected(bpy.types.Operator):
+    bl_idname = "mesh.transform_selected_bulk"
+    bl_label = "Transform Selected Vertices"
+    bl_description = "Align, quantize or scale all selected vertices in one array pass"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: EnumProperty(
+        name="Mode",
+        items=[('ALIGN', "Align", "Flatten to the mean of the selection"),
+               ('QUANTIZE', "Quantize", "Round coordinates to the grid step"),
+               ('SCALE', "Scale", "Scale about the pivot")],
+        default='ALIGN'
+    )
+    axis: EnumProperty(
+        name="Axis",
+        items=[('X', "X", ""), ('Y', "Y", ""), ('Z', "Z", ""), ('XYZ', "All", "")],
+        default='XYZ'
+    )
+    step: FloatProperty(name="Step", description="Grid step for Quantize", default=0.1, min=0.0, precision=3)
+    factor: FloatProperty(name="Factor", description="Scale factor for Scale", default=1.0, precision=3)
+    pivot: EnumProperty(
+        name="Pivot",
+        items=[('MEDIAN', "Median", "Mean of the selected vertices"),
+               ('CURSOR', "3D Cursor", "The 3D cursor")],
+        default='MEDIAN'
+    )
+
+    def execute(self, context):
+        obj = context.edit_object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Must be in Edit Mode on a mesh object")
+            return {'CANCELLED'}
+
+        if not obj.data.total_vert_sel:
+            self.report({'WARNING'}, "No vertices selected")
+            return {'CANCELLED'}
+
+        pivot = None
+        if self.pivot == 'CURSOR':
+            pivot = obj.matrix_world.inverted() @ context.scene.cursor.location
+        value = self.step if self.mode == 'QUANTIZE' else self.factor
+        transform_selected(obj, lambda co: transform_coords(co, self.mode, self.axis, value, pivot))
+        return {'FINISHED'}
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "mode")
+        layout.prop(self, "axis")
+        if self.mode == 'QUANTIZE':
+            layout.prop(self, "step")
+        elif self.mode == 'SCALE':
+            layout.prop(self, "factor")
+            layout.prop(self, "pivot")
+
 class EDITVERTEX_PT_panel(bpy.types.Panel):
     bl_label = "Edit Vertex Tools"
     bl_idname = "EDITVERTEX_PT_panel"
@@ -242,11 +662,17 @@ class EDITVERTEX_PT_panel(bpy.types.Panel):
         layout.label(text="Add Vertex:")
         layout.operator("mesh.add_vertex_at_cursor", icon='CURSOR')
         layout.operator("mesh.connect_vertex_at_cursor", icon='VERTEXSEL')
+        layout.operator("mesh.draw_polyline_at_clicks", icon='CURVE_PATH')
 
         layout.separator()
         layout.label(text="Copy/Paste Vertices:")
         layout.operator("mesh.copy_selected_vertices", icon='COPYDOWN')
-        layout.operator("mesh.paste_copied_vertices", icon='PASTEDOWN')
+        row = layout.row(align=True)
+        row.operator("mesh.paste_copied_vertices", text="Paste Local", icon='PASTEDOWN').space = 'LOCAL'
+        row.operator("mesh.paste_copied_vertices", text="Paste World").space = 'WORLD'
+        row = layout.row(align=True)
+        row.operator("mesh.save_vertex_clipboard", text="Save", icon='EXPORT')
+        row.operator("mesh.load_vertex_clipboard", text="Load", icon='IMPORT')
 
         layout.separator()
         layout.label(text="Move Selected Vertices:")
@@ -263,15 +689,31 @@ class EDITVERTEX_PT_panel(bpy.types.Panel):
         row.operator("mesh.snap_axis_from_first", text="Y").axis = 'Y'
         row.operator("mesh.snap_axis_from_first", text="Z").axis = 'Z'
 
+        layout.separator()
+        layout.label(text="Bulk Transform Selected:")
+        row = layout.row(align=True)
+        row.label(text="Align:")
+        for axis in ('X', 'Y', 'Z'):
+            op = row.operator("mesh.transform_selected_bulk", text=axis)
+            op.mode = 'ALIGN'
+            op.axis = axis
+        row = layout.row(align=True)
+        row.operator("mesh.transform_selected_bulk", text="Quantize").mode = 'QUANTIZE'
+        row.operator("mesh.transform_selected_bulk", text="Scale").mode = 'SCALE'
+
 
 # Register
 classes = (
     EDITVERTEX_OT_add_vertex_cursor,
     EDITVERTEX_OT_connect_vertex_cursor,
+    EDITVERTEX_OT_draw_polyline,
     EDITVERTEX_OT_copy_vertices,
     EDITVERTEX_OT_paste_vertices,
+    EDITVERTEX_OT_save_clipboard,
+    EDITVERTEX_OT_load_clipboard,
     EDITVERTEX_OT_move_selected_axis,
     EDITVERTEX_OT_snap_axis_from_first,
+    EDITVERTEX_OT_transform_selected,
     EDITVERTEX_PT_panel,
 )
 
@@ -9,6 +9,7 @@ bl_info = {
 }
 
 import bpy
+import numpy as np
 from bpy.props import IntProperty, FloatProperty, PointerProperty, EnumProperty
 from bpy.app.handlers import persistent
 
@@ -16,6 +17,78 @@ last_selected_object = None  # Tracks last selected object for comparison
 
 # -------- GRID ARRANGER --------
 
+def world_bounds(objs):
+    """World space bounding box min and max of each object, as (N, 3) arrays"""
+    corners = np.empty((len(objs), 8, 3))
+    for i, obj in enumerate(objs):
+        matrix = np.array(obj.matrix_world)
+        corners[i] = np.array(obj.bound_box) @ matrix[:3, :3].T + matrix[:3, 3]
+    return corners.min(axis=1), corners.max(axis=1)
+
+def pack_shelves(widths, heights, strip_width, first_fit):
+    """Place rectangles on shelves of a strip; returns their top-left offsets.
+
+    first_fit reuses any earlier shelf with room, otherwise only the last
+    shelf is filled so the input order reads left to right, top to bottom.
+    """
+    count = len(widths)
+    x = np.empty(count)
+    y = np.empty(count)
+    shelf_top = np.empty(count)
+    shelf_height = np.empty(count)
+    shelf_used = np.empty(count)
+    shelves = 0
+    for i in range(count):
+        w, h = widths[i], heights[i]
+        shelf = -1
+        if shelves:
+            if first_fit:
+                fits = np.flatnonzero((shelf_used[:shelves] + w <= strip_width) & (shelf_height[:shelves] >= h))
+                if len(fits):
+                    shelf = fits[0]
+            elif shelf_used[shelves - 1] + w <= strip_width:
+                shelf = shelves - 1
+                shelf_height[shelf] = max(shelf_height[shelf], h)
+        if shelf < 0:
+            shelf = shelves
+            shelf_top[shelf] = shelf_top[shelf - 1] + shelf_height[shelf - 1] if shelves else 0.0
+            shelf_height[shelf] = h
+            shelf_used[shelf] = 0.0
+            shelves += 1
+        x[i] = shelf_used[shelf]
+        y[i] = shelf_top[shelf]
+        shelf_used[shelf] += w
+    return x, y
+
+
+AXIS_INDEX = {'X': 0, 'Y': 1, 'Z': 2}
+
+def read_locations(objs):
+    return np.array([obj.location for obj in objs], dtype=np.float64).reshape(-1, 3)
+
+def write_locations(objs, locations):
+    # One assignment per object instead of one per changed component
+    for obj, location in zip(objs, locations.tolist()):
+        obj.location = location
+
+def transform_locations(locations, axis, mode, value):
+    """Apply an align, offset, distribute or snap along one axis to an (N, 3) array"""
+    column = locations[:, AXIS_INDEX[axis]]
+    if mode == 'ALIGN':
+        column[:] = value
+    elif mode == 'OFFSET':
+        column += value
+    elif mode == 'DISTRIBUTE':
+        order = np.argsort(column, kind='stable')
+        column[order] = np.linspace(column.min(), column.max(), len(column))
+    elif mode == 'SNAP' and value > 0.0:
+        column[:] = np.round(column / value) * value
+    return locations
+
+def selected_meshes(context):
+    return [obj for obj in context.selected_objects if obj.type == 'MESH']
+
+
 # ---------- OPERATORS ----------
 
 class GRIDSORTER_OT_arrange_grid(bpy.types.Operator):
@@ -33,6 +106,10 @@ class GRIDSORTER_OT_arrange_grid(bpy.types.Operator):
             self.report({'WARNING'}, "Check selection and grid count")
             return {'CANCELLED'}
 
+        if props.layout_mode == 'PACK':
+            self.pack(selected, props)
+            return {'FINISHED'}
+
         selected.sort(key=lambda o: o.name.lower())
 
         for i, obj in enumerate(selected):
@@ -43,6 +120,35 @@ class GRIDSORTER_OT_arrange_grid(bpy.types.Operator):
 
         return {'FINISHED'}
 
+    def pack(self, selected, props):
+        low, high = world_bounds(selected)
+        margin = props.pack_margin
+        widths = high[:, 0] - low[:, 0] + margin
+        heights = high[:, 2] - low[:, 2] + margin
+
+        if props.sort_key == 'AREA':
+            order = np.argsort(-(widths * heights), kind='stable')
+        elif props.sort_key == 'HEIGHT':
+            order = np.argsort(-heights, kind='stable')
+        else:
+            order = np.array(sorted(range(len(selected)), key=lambda i: selected[i].name.lower()), dtype=np.int64)
+
+        strip_width = props.pack_width
+        if strip_width <= 0.0:
+            strip_width = float(np.sqrt((widths * heights).sum()))
+        strip_width = max(strip_width, float(widths.max()))
+
+        x, y = pack_shelves(widths[order], heights[order], strip_width, props.sort_key != 'NAME')
+
+        # Shift each object so its bounding box corner lands on its slot (X right, Z down)
+        delta_x = np.empty(len(selected))
+        delta_z = np.empty(len(selected))
+        delta_x[order] = x - low[order, 0]
+        delta_z[order] = -y - high[order, 2]
+        for obj, dx, dz in zip(selected, delta_x, delta_z):
+            location = obj.location
+            obj.location = (location.x + dx, location.y, location.z + dz)
+
 # -------- AXIS ALIGNERS --------
 
 class ALIGN_OT_axis(bpy.types.Operator):
@@ -57,9 +163,8 @@ class ALIGN_OT_axis(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.grid_sorter_props
         value = getattr(props, f'align_{self.axis.lower()}')
-        for obj in context.selected_objects:
-            if obj.type == 'MESH':
-                setattr(obj.location, self.axis.lower(), value)
+        objs = selected_meshes(context)
+        write_locations(objs, transform_locations(read_locations(objs), self.axis, 'ALIGN', value))
         return {'FINISHED'}
 
 
@@ -75,10 +180,32 @@ class MOVE_OT_axis(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.grid_sorter_props
         offset = getattr(props, f'move_{self.axis.lower()}')
-        for obj in context.selected_objects:
-            if obj.type == 'MESH':
-                old_val = getattr(obj.location, self.axis.lower())
-                setattr(obj.location, self.axis.lower(), old_val + offset)
+        objs = selected_meshes(context)
+        write_locations(objs, transform_locations(read_locations(objs), self.axis, 'OFFSET', offset))
+        return {'FINISHED'}
+
+
+class BULK_OT_axis_transform(bpy.types.Operator):
+    bl_idname = "object.bulk_axis_transform"
+    bl_label = "Distribute / Snap on Axis"
+    bl_description = "Distribute selected objects evenly or snap them to a step along an axis"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    axis: EnumProperty(
+        items=[('X', "X Axis", ""), ('Y', "Y Axis", ""), ('Z', "Z Axis", "")]
+    )
+    mode: EnumProperty(
+        items=[('DISTRIBUTE', "Distribute", "Space objects evenly between the outermost ones"),
+               ('SNAP', "Snap", "Round positions to the snap step")]
+    )
+
+    def execute(self, context):
+        objs = selected_meshes(context)
+        if len(objs) < 2 and self.mode == 'DISTRIBUTE':
+            self.report({'WARNING'}, "Select at least two objects to distribute")
+            return {'CANCELLED'}
+        step = context.scene.grid_sorter_props.snap_step
+        write_locations(objs, transform_locations(read_locations(objs), self.axis, self.mode, step))
         return {'FINISHED'}
 
 
@@ -97,8 +224,14 @@ class GRIDSORTER_PT_panel(bpy.types.Panel):
 
         # Grid section
         layout.label(text="Grid Arrangement (X/Z):")
-        layout.prop(props, "per_row")
-        layout.prop(props, "spacing")
+        layout.prop(props, "layout_mode", expand=True)
+        if props.layout_mode == 'PACK':
+            layout.prop(props, "sort_key")
+            layout.prop(props, "pack_width")
+            layout.prop(props, "pack_margin")
+        else:
+            layout.prop(props, "per_row")
+            layout.prop(props, "spacing")
         layout.operator("object.arrange_objects_grid_xz", icon='GRID')
 
         layout.separator()
@@ -129,6 +262,23 @@ class GRIDSORTER_PT_panel(bpy.types.Panel):
         row.prop(props, "move_z")
         row.operator("object.move_objects_axis", text="Move Z").axis = 'Z'
 
+        layout.separator()
+        layout.label(text="Distribute / Snap:")
+        row = layout.row(align=True)
+        for axis in ('X', 'Y', 'Z'):
+            op = row.operator("object.bulk_axis_transform", text=f"Spread {axis}")
+            op.axis = axis
+            op.mode = 'DISTRIBUTE'
+        layout.prop(props, "snap_step")
+        row = layout.row(align=True)
+        for axis in ('X', 'Y', 'Z'):
+            op = row.operator("object.bulk_axis_transform", text=f"Snap {axis}")
+            op.axis = axis
+            op.mode = 'SNAP'
+
+        layout.separator()
+        layout.label(text=f"Selection sync: {sync_stats['notifications']} events, {sync_stats['syncs']} syncs")
+
 
 # ---------- PROPERTIES ----------
 
@@ -136,6 +286,22 @@ class GRIDSORTER_Properties(bpy.types.PropertyGroup):
     per_row: IntProperty(name="Objects per Row", default=5, min=1)
     spacing: IntProperty(name="Grid Spacing", default=3, min=1)
 
+    layout_mode: EnumProperty(
+        name="Layout",
+        items=[('GRID', "Grid", "Fixed spacing grid sorted by name"),
+               ('PACK', "Pack", "Pack by world bounding box size on shelves")],
+        default='GRID'
+    )
+    sort_key: EnumProperty(
+        name="Sort",
+        items=[('NAME', "Name", "Keep name order, reading left to right"),
+               ('AREA', "Area", "Largest footprint first"),
+               ('HEIGHT', "Height", "Tallest first")],
+        default='HEIGHT'
+    )
+    pack_width: FloatProperty(name="Pack Width", description="Strip width, 0 for roughly square", default=0.0, min=0.0)
+    pack_margin: FloatProperty(name="Margin", default=0.1, min=0.0)
+
     align_x: FloatProperty(name="X", default=0.0)
     align_y: FloatProperty(name="Y", default=0.0)
     align_z: FloatProperty(name="Z", default=0.0)
@@ -145,12 +311,21 @@ class GRIDSORTER_Properties(bpy.types.PropertyGroup):
     move_y: FloatProperty(name="Move Y", default=0.0)
     move_z: FloatProperty(name="Move Z", default=0.0)
 
+    snap_step: FloatProperty(name="Snap Step", default=1.0, min=0.0)
+
 
 # ---------- SYNC HANDLER ----------
+# Runs on active object changes through the message bus instead of every
+# depsgraph update. Bursts of notifications are coalesced by a short timer.
+
+SYNC_DELAY = 0.05
+_msgbus_owner = object()
+sync_stats = {"notifications": 0, "syncs": 0}
+_sync_pending = False
 
-@persistent
 def update_axis_properties(scene):
     global last_selected_object
+    sync_stats["syncs"] += 1
     obj = scene.view_layers[0].objects.active
     if obj and obj != last_selected_object and obj.select_get() and obj.type == 'MESH':
         props = scene.grid_sorter_props
@@ -159,6 +334,37 @@ def update_axis_properties(scene):
         props.align_z = obj.location.z
         last_selected_object = obj
 
+def _run_pending_sync():
+    global _sync_pending
+    _sync_pending = False
+    scene = bpy.context.scene
+    if scene is not None:
+        update_axis_properties(scene)
+    return None
+
+def _on_active_changed():
+    global _sync_pending
+    sync_stats["notifications"] += 1
+    if not _sync_pending:
+        _sync_pending = True
+        bpy.app.timers.register(_run_pending_sync, first_interval=SYNC_DELAY)
+
+def subscribe_selection_sync():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.LayerObjects, "active"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=_on_active_changed,
+    )
+
+@persistent
+def resubscribe_on_load(dummy):
+    # Loading a file drops all message bus subscriptions
+    global last_selected_object
+    last_selected_object = None
+    subscribe_selection_sync()
+
 
 # ---------- REGISTER ----------
 
@@ -166,6 +372,7 @@ classes = (
     GRIDSORTER_OT_arrange_grid,
     ALIGN_OT_axis,
     MOVE_OT_axis,
+    BULK_OT_axis_transform,
     GRIDSORTER_PT_panel,
     GRIDSORTER_Properties,
 )
@@ -174,10 +381,14 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.grid_sorter_props = PointerProperty(type=GRIDSORTER_Properties)
-    bpy.app.handlers.depsgraph_update_post.append(update_axis_properties)
+    subscribe_selection_sync()
+    bpy.app.handlers.load_post.append(resubscribe_on_load)
 
 def unregister():
-    bpy.app.handlers.depsgraph_update_post.remove(update_axis_properties)
+    bpy.app.handlers.load_post.remove(resubscribe_on_load)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    if bpy.app.timers.is_registered(_run_pending_sync):
+        bpy.app.timers.unregister(_run_pending_sync)
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.grid_sorter_props
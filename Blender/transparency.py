@@ -10,6 +10,89 @@ bl_info = {
 
 import bpy
 
+SHARED_MATERIAL_NAME = "SharedAlphaMaterial"
+ALPHA_PROPERTY = "transparency_alpha"
+ALPHA_SAVED_SLOTS = "transparency_saved_slots"
+ALPHA_ADDED_SLOT = "transparency_added_slot"
+
+
+def ensure_shared_alpha_material():
+    """One material for every object: base color and alpha come from the object"""
+    mat = bpy.data.materials.get(SHARED_MATERIAL_NAME)
+    if mat is not None:
+        return mat
+
+    mat = bpy.data.materials.new(name=SHARED_MATERIAL_NAME)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    bsdf = nodes.get("Principled BSDF")
+
+    info = nodes.new(type="ShaderNodeObjectInfo")
+    info.location = (-300, 100)
+    links.new(info.outputs["Color"], bsdf.inputs["Base Color"])
+
+    attribute = nodes.new(type="ShaderNodeAttribute")
+    attribute.attribute_type = 'OBJECT'
+    attribute.attribute_name = ALPHA_PROPERTY
+    attribute.location = (-300, -150)
+    links.new(attribute.outputs["Fac"], bsdf.inputs["Alpha"])
+
+    mat.blend_method = 'BLEND'
+    mat.shadow_method = 'NONE'
+    mat.show_transparent_back = False
+    return mat
+
+
+def assign_shared_material(obj, mat):
+    """Override every slot on the object level so the mesh keeps its materials
+
+    The first call records each slot's link and object material so
+    clear_shared_material can put them back.
+    """
+    saved = ALPHA_SAVED_SLOTS not in obj
+    links, materials = [], []
+    if not obj.material_slots:
+        # Remembered on the mesh, which may be shared by several objects
+        obj.data.materials.append(None)
+        obj.data[ALPHA_ADDED_SLOT] = True
+    for slot in obj.material_slots:
+        links.append(slot.link)
+        # Reading the object level material even when the slot shows the mesh one
+        slot.link = 'OBJECT'
+        materials.append(slot.material.name if slot.material else "")
+        if slot.material != mat:
+            slot.material = mat
+    if saved:
+        obj[ALPHA_SAVED_SLOTS] = {"links": links, "materials": materials}
+
+
+def clear_shared_material(obj, mat):
+    saved = obj.get(ALPHA_SAVED_SLOTS)
+    links = list(saved["links"]) if saved else []
+    materials = list(saved["materials"]) if saved else []
+    for i, slot in enumerate(obj.material_slots):
+        if slot.link != 'OBJECT' or slot.material != mat:
+            continue
+        if i < len(links):
+            slot.material = bpy.data.materials.get(materials[i]) if materials[i] else None
+            slot.link = links[i]
+        else:
+            slot.material = None
+            slot.link = 'DATA'
+
+    for key in (ALPHA_PROPERTY, ALPHA_SAVED_SLOTS):
+        if key in obj:
+            del obj[key]
+
+    mesh = obj.data
+    if mesh.get(ALPHA_ADDED_SLOT) and not any(
+            other.data == mesh and ALPHA_SAVED_SLOTS in other for other in bpy.data.objects):
+        if len(mesh.materials) == 1 and mesh.materials[0] is None:
+            mesh.materials.pop(index=0)
+        del mesh[ALPHA_ADDED_SLOT]
+
+
 class TRANSPARENCY_OT_enable_viewport(bpy.types.Operator):
     bl_idname = "object.enable_viewport_transparency"
     bl_label = "Enable Viewport Transparency"
@@ -24,7 +107,19 @@ class TRANSPARENCY_OT_enable_viewport(bpy.types.Operator):
         max=1.0
     )
 
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('MATERIAL', "Edit Material", "Change the alpha of the active material (affects all its users)"),
+            ('SHARED', "Shared Material", "Selected objects use one shared material reading a per-object alpha"),
+        ],
+        default='MATERIAL'
+    )
+
     def execute(self, context):
+        if self.mode == 'SHARED':
+            return self.apply_shared(context)
+
         obj = context.object
         if obj is None or obj.type != 'MESH':
             self.report({'ERROR'}, "Please select a mesh object")
@@ -54,6 +149,36 @@ class TRANSPARENCY_OT_enable_viewport(bpy.types.Operator):
         self.report({'INFO'}, f"Transparency set to {self.alpha_value}")
         return {'FINISHED'}
 
+    def apply_shared(self, context):
+        objs = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objs:
+            self.report({'ERROR'}, "Please select mesh objects")
+            return {'CANCELLED'}
+
+        mat = ensure_shared_alpha_material()
+        for obj in objs:
+            obj[ALPHA_PROPERTY] = self.alpha_value
+            assign_shared_material(obj, mat)
+            obj.update_tag()
+
+        self.report({'INFO'}, f"Transparency set to {self.alpha_value} on {len(objs)} objects")
+        return {'FINISHED'}
+
+class TRANSPARENCY_OT_disable_shared(bpy.types.Operator):
+    bl_idname = "object.disable_shared_transparency"
+    bl_label = "Disable Shared Transparency"
+    bl_description = "Return selected objects to the materials they had before"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        mat = bpy.data.materials.get(SHARED_MATERIAL_NAME)
+        if mat is None:
+            return {'CANCELLED'}
+        for obj in context.selected_objects:
+            if obj.type == 'MESH':
+                clear_shared_material(obj, mat)
+        return {'FINISHED'}
+
 class TRANSPARENCY_PT_panel(bpy.types.Panel):
     bl_label = "Transparency"
     bl_idname = "TRANSPARENCY_PT_panel"
@@ -66,9 +191,15 @@ class TRANSPARENCY_PT_panel(bpy.types.Panel):
         layout.label(text="Make Object Transparent:")
         layout.operator("object.enable_viewport_transparency")
 
+        layout.separator()
+        layout.label(text="Shared Material (per-object alpha):")
+        layout.operator("object.enable_viewport_transparency", text="Set Selected Alpha").mode = 'SHARED'
+        layout.operator("object.disable_shared_transparency")
+
 # Register
 classes = [
     TRANSPARENCY_OT_enable_viewport,
+    TRANSPARENCY_OT_disable_shared,
     TRANSPARENCY_PT_panel,
 ]
 
@@ -1,7 +1,11 @@
+import hashlib
+import os
+
 import bpy
-import bmesh
-from mathutils import Vector
-from bpy.props import EnumProperty
+import numpy as np
+from mathutils import kdtree
+from mathutils.bvhtree import BVHTree
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty, StringProperty
 
 bl_info = {
     "name": "Vertex Group Weight Tools",
@@ -9,65 +13,684 @@ bl_info = {
     "category": "Object",
 }
 
-# Global temporary weight storage
-temp_weights = {}
+# Global temporary weight storage: (vertex indices, weights) arrays of one group
+temp_weights = None
+
+AXIS_INDEX = {'X': 0, 'Y': 1, 'Z': 2}
+
+# (mesh session_uid, axis, tolerance) -> (coordinate hash, mirror map)
+_mirror_cache = {}
+# mesh session_uid -> (topology hash, axis, mirror map)
+_topology_cache = {}
+
+TOPOLOGY_MIRROR_PROP = "topology_mirror"
+# mesh session_uid -> (geometry hash, BVHTree, triangle vertex indices, coordinates)
+_bvh_cache = {}
+
+class WeightMatrix:
+    """Vertex group weights of a mesh in compressed sparse row form.
+
+    Row v holds the memberships of vertex v: groups[indptr[v]:indptr[v + 1]]
+    with the matching weights.
+    """
+
+    def __init__(self, indptr, groups, weights):
+        self.indptr = indptr
+        self.groups = groups
+        self.weights = weights
+        self._rows = None
+
+    @property
+    def vertex_count(self):
+        return len(self.indptr) - 1
+
+    def rows(self):
+        """Vertex index of every stored weight"""
+        if self._rows is None:
+            self._rows = np.repeat(np.arange(self.vertex_count, dtype=np.int32), np.diff(self.indptr))
+        return self._rows
+
+    def column(self, group_index):
+        """(vertex indices, weights) of one group"""
+        mask = self.groups == group_index
+        return self.rows()[mask], self.weights[mask]
+
+def read_weight_matrix(obj):
+    """Read every vertex group membership of obj in a single pass"""
+    if obj.mode == 'EDIT':
+        obj.update_from_editmode()
+    counts = []
+    groups = []
+    weights = []
+    for v in obj.data.vertices:
+        memberships = v.groups
+        counts.append(len(memberships))
+        for g in memberships:
+            groups.append(g.group)
+            weights.append(g.weight)
+    indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return WeightMatrix(indptr, np.array(groups, dtype=np.int32), np.array(weights, dtype=np.float32))
+
+def read_vertex_coords(obj):
+    co = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
 
 def get_active_vertex_group(obj):
     index = obj.vertex_groups.active_index
     return obj.vertex_groups[index] if index >= 0 else None
 
 def get_vertex_group_weights(obj, group):
-    weights = {}
-    for v in obj.data.vertices:
-        for g in v.groups:
-            if g.group == group.index:
-                weights[v.index] = g.weight
-    return weights
+    return read_weight_matrix(obj).column(group.index)
+
+WEIGHT_STEPS = 1 << 12  # Weights are written in steps of 1/4096
+
+def quantize_weights(weights):
+    return (np.round(np.clip(weights, 0.0, 1.0) * WEIGHT_STEPS) / WEIGHT_STEPS).astype(np.float32)
+
+def write_group_weights(group, indices, weights):
+    """Assign weights with one group.add call per distinct quantised value"""
+    if not len(indices):
+        return 0
+    values, inverse = np.unique(quantize_weights(weights), return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    splits = np.cumsum(np.bincount(inverse, minlength=len(values)))[:-1]
+    for value, members in zip(values.tolist(), np.split(np.asarray(indices)[order], splits)):
+        group.add(members.tolist(), value, 'REPLACE')
+    return len(values)
+
+def update_group_weights(obj, group, indices, weights, current=None, replace_all=False):
+    """Write only the vertices whose weight changes.
+
+    current is the group's (indices, weights) as read from the weight matrix.
+    With replace_all, members missing from indices are removed from the group.
+    """
+    if current is None:
+        current = get_vertex_group_weights(obj, group)
+    count = len(obj.data.vertices)
+    old = np.full(count, -1.0, dtype=np.float32)
+    old[current[0]] = current[1]
+    new = np.full(count, -1.0, dtype=np.float32)
+    valid = (indices >= 0) & (indices < count)
+    new[indices[valid]] = quantize_weights(weights[valid])
+    if not replace_all:
+        new = np.where(new < 0, old, new)
+
+    removed = np.flatnonzero((old >= 0) & (new < 0))
+    if len(removed):
+        group.remove(removed.tolist())
+    changed = np.flatnonzero((new >= 0) & (np.abs(new - old) > 0.5 / WEIGHT_STEPS))
+    write_group_weights(group, changed, new[changed])
+    return len(removed) + len(changed)
+
+def set_vertex_group_weights(obj, group, indices, weights):
+    return update_group_weights(obj, group, indices, weights, replace_all=True)
+
+def clear_vertex_group(obj, group):
+    members, _ = get_vertex_group_weights(obj, group)
+    if len(members):
+        group.remove(members.tolist())
+    return len(members)
+
+def write_weight_entries(obj, matrix, rows, groups, weights, group_indices):
+    """Replace the weights of every group in group_indices with its (row, weight) entries.
+
+    matrix holds the current weights, so only changed vertices are written.
+    Returns the number of weights written or removed.
+    """
+    order = np.argsort(groups, kind='stable')
+    rows, groups, weights = rows[order], groups[order], weights[order]
+    group_indices = np.asarray(group_indices)
+    starts = np.searchsorted(groups, group_indices, side='left')
+    ends = np.searchsorted(groups, group_indices, side='right')
+    written = 0
+    for index, start, end in zip(group_indices.tolist(), starts.tolist(), ends.tolist()):
+        written += update_group_weights(obj, obj.vertex_groups[index], rows[start:end], weights[start:end],
+                                        matrix.column(index), replace_all=True)
+    return written
+
+def coords_hash(co):
+    return hashlib.blake2b(co.tobytes(), digest_size=16).digest()
+
+def build_mirror_map(co, axis, tolerance):
+    tree = kdtree.KDTree(len(co))
+    for i, c in enumerate(co.tolist()):
+        tree.insert(c, i)
+    tree.balance()
+
+    mirrored = co.copy()
+    mirrored[:, AXIS_INDEX[axis]] *= -1
+    mirror = np.full(len(co), -1, dtype=np.int64)
+    for i, c in enumerate(mirrored.tolist()):
+        _co, index, dist = tree.find(c)
+        if index is not None and dist <= tolerance:
+            mirror[i] = index
+    return mirror
+
+def mirror_index_map(obj, axis, tolerance=0.001):
+    """Mirror vertex of every vertex across axis, -1 where none is within tolerance.
+
+    Maps are cached per mesh and axis and rebuilt when the vertex coordinates change.
+    """
+    co = read_vertex_coords(obj)
+    stamp = coords_hash(co)
+    key = (obj.data.session_uid, axis, tolerance)
+    cached = _mirror_cache.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, build_mirror_map(co, axis, tolerance))
+        _mirror_cache[key] = cached
+    return cached[1]
+
+# Topology Mirror
+
+def topology_hash(mesh):
+    """Hash of the edges and face corners of a mesh; weights and mirror maps follow vertex indices"""
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    mesh.polygons.foreach_get("loop_start", starts)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    counts = np.array((len(mesh.vertices), len(edges), len(starts), len(loop_verts)), dtype=np.int64)
+    return hashlib.blake2b(b"".join(a.tobytes() for a in (counts, edges, starts, loop_verts)),
+                           digest_size=16).hexdigest()
+
+def loop_adjacency(mesh):
+    """Face corner arrays: vertex, face, next corner and opposite corner (-1 on boundaries).
+
+    Corner l is the half-edge from loop_vert[l] to loop_vert[next_loop[l]].
+    """
+    loop_vert = np.empty(len(mesh.loops), dtype=np.int32)
+    starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vert)
+    mesh.polygons.foreach_get("loop_start", starts)
+    mesh.polygons.foreach_get("loop_total", totals)
+    loop_vert = loop_vert.astype(np.int64)
+
+    loop_face = np.repeat(np.arange(len(totals)), totals)
+    corner = np.arange(len(loop_vert)) - starts[loop_face]
+    next_loop = starts[loop_face] + (corner + 1) % totals[loop_face]
+
+    count = len(mesh.vertices)
+    keys = loop_vert * count + loop_vert[next_loop]
+    twin_keys = loop_vert[next_loop] * count + loop_vert
+    order = np.argsort(keys, kind='stable')
+    found = np.minimum(np.searchsorted(keys[order], twin_keys), len(keys) - 1)
+    twin = np.where(keys[order][found] == twin_keys, order[found], -1) if len(keys) else found
+    return loop_vert, loop_face, next_loop, twin
+
+def selected_seed_edge(obj):
+    """Sorted vertex pair when exactly two vertices are selected, else None"""
+    select = np.zeros(len(obj.data.vertices), dtype=bool)
+    obj.data.vertices.foreach_get("select", select)
+    picked = np.flatnonzero(select)
+    return tuple(picked.tolist()) if len(picked) == 2 else None
+
+def find_seed_corner(obj, axis, loop_vert, next_loop, twin, seed_edge=None):
+    """Interior half-edge to start the symmetry walk from.
+
+    seed_edge is used when it is an interior edge, otherwise the edge closest
+    to the symmetry plane.
+    """
+    inner = np.flatnonzero(twin >= 0)
+    if not len(inner):
+        return -1
+    if seed_edge is not None:
+        a, b = seed_edge
+        match = (loop_vert[inner] == a) & (loop_vert[next_loop[inner]] == b)
+        if match.any():
+            return int(inner[match][0])
+    offset = np.abs(read_vertex_coords(obj)[:, AXIS_INDEX[axis]])
+    distance = offset[loop_vert[inner]] + offset[loop_vert[next_loop[inner]]]
+    return int(inner[np.argmin(distance)])
+
+def solve_topology_mirror(obj, axis='X', seed_edge=None):
+    """Map every vertex to its topological mirror by walking faces from a center edge.
+
+    The seed edge maps onto itself with its direction reversed. Each face is
+    then walked forwards while its mirror face is walked backwards, and the
+    walk spreads across shared edges, so every face is visited once.
+    Returns the map (-1 for unreached vertices) and the number of conflicts.
+    """
+    loop_vert, loop_face, next_loop, twin = loop_adjacency(obj.data)
+    mirror = np.full(len(obj.data.vertices), -1, dtype=np.int64)
+    seed = find_seed_corner(obj, axis, loop_vert, next_loop, twin, seed_edge)
+    if seed < 0:
+        return mirror, 0
+
+    prev_loop = np.empty_like(next_loop)
+    prev_loop[next_loop] = np.arange(len(next_loop))
+    face_size = np.bincount(loop_face).tolist()
+    face_done = np.zeros(len(face_size), dtype=bool)
+    loop_vert, loop_face = loop_vert.tolist(), loop_face.tolist()
+    next_loop, prev_loop, twin = next_loop.tolist(), prev_loop.tolist(), twin.tolist()
+    mirror_list = mirror.tolist()
+    conflicts = 0
+
+    # (corner u -> v, mirror corner v' -> u')
+    queue = [(seed, twin[seed])]
+    while queue:
+        corner, mirror_corner = queue.pop()
+        face, mirror_face = loop_face[corner], loop_face[mirror_corner]
+        if face_done[face]:
+            continue
+        face_done[face] = face_done[mirror_face] = True
+        if face_size[face] != face_size[mirror_face]:
+            conflicts += 1
+            continue
+
+        a, b = corner, next_loop[mirror_corner]
+        while True:
+            va, vb = loop_vert[a], loop_vert[b]
+            if mirror_list[va] in (-1, vb) and mirror_list[vb] in (-1, va):
+                mirror_list[va], mirror_list[vb] = vb, va
+            else:
+                conflicts += 1
+            b = prev_loop[b]
+            # Half-edge a -> next(a) mirrors to b -> a', spread across both
+            if twin[a] >= 0 and twin[b] >= 0 and not face_done[loop_face[twin[a]]]:
+                queue.append((twin[a], twin[b]))
+            a = next_loop[a]
+            if a == corner:
+                break
+    return np.array(mirror_list, dtype=np.int64), conflicts
 
-def set_vertex_group_weights(obj, group, weights_dict):
-    group.remove([v.index for v in obj.data.vertices])  # Clear old weights
-    for v_index, weight in weights_dict.items():
-        group.add([v_index], weight, 'REPLACE')
+def topology_mirror_map(obj, axis='X'):
+    """Topological mirror map of obj's mesh and its number of conflicts.
 
-def mirror_vertex_group(obj, group, axis, replace=True):
+    Selecting exactly two vertices picks the seed edge. Maps solved without
+    conflicts are cached in memory and in mesh["topology_mirror"] under the
+    topology hash, axis and seed edge, so other vertex tools can reuse them.
+    Maps with conflicts are returned but never cached.
+    """
+    mesh = obj.data
+    seed_edge = selected_seed_edge(obj)
+    key = (topology_hash(mesh), axis, list(seed_edge or ()))
+    cached = _topology_cache.get(mesh.session_uid)
+    if cached is not None and cached[0] == key:
+        return cached[1], 0
+
+    stored = mesh.get(TOPOLOGY_MIRROR_PROP)
+    if stored is not None and (stored.get("hash"), stored.get("axis"), list(stored.get("seed", ()))) == key:
+        mirror = np.array(stored["map"], dtype=np.int64)
+    else:
+        mirror, conflicts = solve_topology_mirror(obj, axis, seed_edge)
+        if conflicts:
+            return mirror, conflicts
+        mesh[TOPOLOGY_MIRROR_PROP] = {"hash": key[0], "axis": axis, "seed": key[2], "map": mirror.tolist()}
+    _topology_cache[mesh.session_uid] = (key, mirror)
+    return mirror, 0
+
+def get_mirror_map(obj, axis, tolerance=0.001, method='POSITION'):
+    """Mirror map and number of topology conflicts (always 0 for positions)"""
+    if method == 'TOPOLOGY':
+        return topology_mirror_map(obj, axis)
+    return mirror_index_map(obj, axis, tolerance), 0
+
+def mirror_vertex_group(obj, group, axis, replace=True, tolerance=0.001, method='POSITION'):
+    """Mirror group onto itself.
+
+    Returns the number of weighted vertices without a mirror and of topology conflicts.
+    """
     original_mode = obj.mode
     bpy.ops.object.mode_set(mode='OBJECT')
-    mesh = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.verts.ensure_lookup_table()
 
-    pos_to_index = { (round(v.co.x, 6), round(v.co.y, 6), round(v.co.z, 6)) : v.index for v in bm.verts }
-    index_map = {}
+    current = get_vertex_group_weights(obj, group)
+    source, weights = current
+    mirror, conflicts = get_mirror_map(obj, axis, tolerance, method)
+    targets = mirror[source]
+    found = targets >= 0
+    targets, weights = targets[found], weights[found]
+
+    if not replace:
+        # Only add if there's no existing weight
+        keep = ~np.isin(targets, source)
+        targets, weights = targets[keep], weights[keep]
+    update_group_weights(obj, group, targets, weights, current)
+
+    if obj.mode != original_mode:
+        bpy.ops.object.mode_set(mode=original_mode)
+    return int(np.count_nonzero(~found)), conflicts
+
+SIDE_TOKENS = (('.L', '.R'), ('.l', '.r'), ('_L', '_R'), ('_l', '_r'),
+               ('Left', 'Right'), ('left', 'right'), ('LEFT', 'RIGHT'))
 
-    for v in bm.verts:
-        mirrored = v.co.copy()
-        if axis == 'X': mirrored.x *= -1
-        elif axis == 'Y': mirrored.y *= -1
-        elif axis == 'Z': mirrored.z *= -1
+def split_side_name(name):
+    """Return (side, opposite name) for a left/right group name, or (None, None)"""
+    base, dot, number = name.rpartition('.')
+    if not (dot and number.isdigit()):
+        base, number = name, ""
+    number = f".{number}" if number else ""
+    for left, right in SIDE_TOKENS:
+        for side, token, other in (('L', left, right), ('R', right, left)):
+            if base.endswith(token):
+                return side, base[:-len(token)] + other + number
+            if token[0] not in '._' and base.startswith(token):
+                return side, other + base[len(token):] + number
+    return None, None
 
-        key = tuple(round(c, 6) for c in mirrored)
-        if key in pos_to_index:
-            index_map[v.index] = pos_to_index[key]
+def side_group_pairs(obj, direction='L_TO_R'):
+    """(source index, target index) of every left/right vertex group pair"""
+    source_side = 'L' if direction == 'L_TO_R' else 'R'
+    pairs = []
+    for group in obj.vertex_groups:
+        side, other_name = split_side_name(group.name)
+        if side != source_side:
+            continue
+        other = obj.vertex_groups.get(other_name)
+        if other is not None and other.index != group.index:
+            pairs.append((group.index, other.index))
+    return pairs
 
-    original_weights = get_vertex_group_weights(obj, group)
+def mirror_side_groups(obj, axis, direction='L_TO_R', replace=True, tolerance=0.001, method='POSITION'):
+    """Mirror every left group onto its right counterpart (or the reverse).
 
-    for src_idx, tgt_idx in index_map.items():
-        if src_idx in original_weights:
+    One weight matrix read and one mirror map serve all pairs. Returns the
+    number of pairs, of weighted source vertices without a mirror and of
+    topology conflicts.
+    """
+    original_mode = obj.mode
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    pairs = side_group_pairs(obj, direction)
+    unmatched = conflicts = 0
+    if pairs:
+        matrix = read_weight_matrix(obj)
+        target_of = np.full(len(obj.vertex_groups), -1, dtype=np.int64)
+        sources, targets = np.array(pairs).T
+        target_of[sources] = targets
+
+        # Move every source-group entry to its mirror vertex and target group at once
+        rows = matrix.rows()
+        entry_targets = target_of[matrix.groups]
+        picked = entry_targets >= 0
+        mirror, conflicts = get_mirror_map(obj, axis, tolerance, method)
+        mirrored = mirror[rows[picked]]
+        found = mirrored >= 0
+        unmatched = int(np.count_nonzero(~found))
+        new_groups = entry_targets[picked][found]
+        new_rows = mirrored[found]
+        new_weights = matrix.weights[picked][found]
+
+        order = np.argsort(new_groups, kind='stable')
+        new_groups, new_rows, new_weights = new_groups[order], new_rows[order], new_weights[order]
+        starts = np.searchsorted(new_groups, targets, side='left')
+        ends = np.searchsorted(new_groups, targets, side='right')
+        for target, start, end in zip(targets.tolist(), starts.tolist(), ends.tolist()):
+            current = matrix.column(target)
+            indices, weights = new_rows[start:end], new_weights[start:end]
+            group = obj.vertex_groups[target]
             if not replace:
-                # Only add if there's no existing weight
-                current = [g.weight for g in obj.data.vertices[tgt_idx].groups if g.group == group.index]
-                if current:
-                    continue
-            group.add([tgt_idx], original_weights[src_idx], 'REPLACE')
-
-    bm.free()
-    # original_mode = obj.mode
+                keep = ~np.isin(indices, current[0])
+                indices, weights = indices[keep], weights[keep]
+            update_group_weights(obj, group, indices, weights, current)
+            if replace:
+                # Target members whose mirror has no source weight go; those without a mirror stay
+                members = current[0]
+                stale = members[(mirror[members] >= 0) & ~np.isin(members, indices)]
+                if len(stale):
+                    group.remove(stale.tolist())
+
     if obj.mode != original_mode:
         bpy.ops.object.mode_set(mode=original_mode)
+    return len(pairs), unmatched, conflicts
+
+# Weight Transfer
+
+def get_source_bvh(obj):
+    """BVH tree over the triangles of obj's mesh, cached until its geometry changes"""
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    tris = tris.reshape(-1, 3)
+    co = read_vertex_coords(obj)
+    stamp = coords_hash(co) + coords_hash(tris)
+    cached = _bvh_cache.get(mesh.session_uid)
+    if cached is None or cached[0] != stamp:
+        bvh = BVHTree.FromPolygons(co.tolist(), tris.tolist())
+        cached = (stamp, bvh, tris, co)
+        _bvh_cache[mesh.session_uid] = cached
+    return cached[1:]
+
+def barycentric_weights(p, a, b, c):
+    """Barycentric coordinates of points p in triangles (a, b, c), all (N, 3)"""
+    v0, v1, v2 = b - a, c - a, p - a
+    d00 = np.einsum('ij,ij->i', v0, v0)
+    d01 = np.einsum('ij,ij->i', v0, v1)
+    d11 = np.einsum('ij,ij->i', v1, v1)
+    d20 = np.einsum('ij,ij->i', v2, v0)
+    d21 = np.einsum('ij,ij->i', v2, v1)
+    denom = d00 * d11 - d01 * d01
+    denom[np.abs(denom) < 1e-12] = 1.0  # Degenerate triangles fall back to the first corner
+    v = (d11 * d20 - d01 * d21) / denom
+    w = (d00 * d21 - d01 * d20) / denom
+    bary = np.clip(np.stack((1.0 - v - w, v, w), axis=1), 0.0, 1.0)
+    return bary / np.maximum(bary.sum(axis=1, keepdims=True), 1e-12)
+
+def gather_rows(matrix, vertices):
+    """Flatten the CSR rows of vertices: (position in vertices, group, weight) per entry"""
+    starts = matrix.indptr[vertices]
+    lengths = matrix.indptr[vertices + 1] - starts
+    owner = np.repeat(np.arange(len(vertices)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    entries = np.repeat(starts, lengths) + offsets
+    return owner, matrix.groups[entries], matrix.weights[entries]
+
+def transfer_weights(source, target):
+    """Interpolate all of source's vertex groups onto target by nearest surface point.
+
+    Works across different topologies: each target vertex takes the
+    barycentric blend of the weights on the closest source triangle.
+    Missing groups are created on target. Returns the number of groups written.
+    """
+    bvh, tris, source_co = get_source_bvh(source)
+    if not len(tris) or not len(target.data.vertices) or not len(source.vertex_groups):
+        return 0
+    matrix = read_weight_matrix(source)
+
+    # Target vertices in the source's local space
+    to_source = np.array(source.matrix_world.inverted() @ target.matrix_world, dtype=np.float64)
+    co = read_vertex_coords(target).astype(np.float64)
+    co = co @ to_source[:3, :3].T + to_source[:3, 3]
+
+    nearest = np.zeros((len(co), 3))
+    triangle = np.zeros(len(co), dtype=np.int64)
+    for i, point in enumerate(co.tolist()):
+        location, _normal, index, _dist = bvh.find_nearest(point)
+        if index is not None:
+            nearest[i] = location
+            triangle[i] = index
+    corners = tris[triangle].astype(np.int64)
+    bary = barycentric_weights(nearest, *(source_co[corners[:, k]].astype(np.float64) for k in range(3)))
+
+    # All groups at once: every corner's weights scaled by its barycentric share
+    rows, groups, weights = [], [], []
+    for k in range(3):
+        owner, g, w = gather_rows(matrix, corners[:, k])
+        rows.append(owner)
+        groups.append(g)
+        weights.append(w * bary[owner, k])
+    rows, groups, weights = np.concatenate(rows), np.concatenate(groups), np.concatenate(weights)
+
+    group_count = len(source.vertex_groups)
+    keys, inverse = np.unique(rows.astype(np.int64) * group_count + groups, return_inverse=True)
+    sums = np.bincount(inverse, weights=weights)
+    keep = sums >= 0.5 / WEIGHT_STEPS
+    rows, groups, sums = keys[keep] // group_count, keys[keep] % group_count, sums[keep]
+
+    target_groups = np.empty(group_count, dtype=np.int64)
+    for source_group in source.vertex_groups:
+        group = target.vertex_groups.get(source_group.name)
+        if group is None:
+            group = target.vertex_groups.new(name=source_group.name)
+        target_groups[source_group.index] = group.index
+    write_weight_entries(target, read_weight_matrix(target), rows, target_groups[groups], sums, target_groups)
+    return group_count
+
+# Weight Cleanup
+
+def read_edges(mesh):
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    return edges.reshape(-1, 2).astype(np.int64)
+
+def entries_to_matrix(rows, groups, weights, vertex_count):
+    order = np.lexsort((groups, rows))
+    indptr = np.zeros(vertex_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=vertex_count), out=indptr[1:])
+    return WeightMatrix(indptr, groups[order], weights[order])
+
+def sum_entries(rows, groups, weights, group_count):
+    """Merge duplicate (row, group) entries by summing their weights"""
+    keys, inverse = np.unique(rows.astype(np.int64) * group_count + groups, return_inverse=True)
+    sums = np.bincount(inverse, weights=weights)
+    return keys // group_count, (keys % group_count).astype(np.int32), sums
+
+def smooth_entries(rows, groups, weights, edges, vertex_count, group_count, factor=0.5, iterations=1):
+    """Laplacian smoothing: blend each vertex's weights towards its edge neighbours' mean"""
+    directed = np.concatenate((edges, edges[:, ::-1]))
+    degree = np.bincount(directed[:, 0], minlength=vertex_count)
+    blend = np.where(degree > 0, factor, 0.0)
+    for _ in range(iterations):
+        matrix = entries_to_matrix(rows, groups, weights, vertex_count)
+        owner, n_groups, n_weights = gather_rows(matrix, directed[:, 1])
+        n_rows = directed[owner, 0]
+        rows, groups, weights = sum_entries(
+            np.concatenate((rows, n_rows)),
+            np.concatenate((groups, n_groups)),
+            np.concatenate(((1.0 - blend[rows]) * weights, blend[n_rows] * n_weights / degree[n_rows])),
+            group_count)
+        keep = weights >= 0.5 / WEIGHT_STEPS
+        rows, groups, weights = rows[keep], groups[keep], weights[keep]
+    return rows, groups, weights
+
+def limit_entries(rows, groups, weights, limit):
+    """Keep the limit largest weights of every vertex; limit may be a per-vertex array"""
+    order = np.lexsort((-weights, rows))
+    rows, groups, weights = rows[order], groups[order], weights[order]
+    first = np.searchsorted(rows, rows, side='left')
+    keep = np.arange(len(rows)) - first < (limit[rows] if np.ndim(limit) else limit)
+    return rows[keep], groups[keep], weights[keep]
+
+def normalize_entries(rows, weights, vertex_count, targets=None):
+    """Scale each vertex's weights to sum to 1, or to targets[vertex]"""
+    totals = np.bincount(rows, weights=weights, minlength=vertex_count)
+    scale = (1.0 if targets is None else targets) / np.where(totals > 0, totals, 1.0)
+    return weights * scale[rows]
+
+def deform_group_mask(obj, subset='BONE_DEFORM'):
+    """Groups the cleanup may touch: deforming bones of the Armature modifiers, or all groups"""
+    if subset == 'ALL':
+        return np.ones(len(obj.vertex_groups), dtype=bool)
+    bones = set()
+    for mod in obj.modifiers:
+        if mod.type == 'ARMATURE' and mod.use_vertex_groups and mod.object and mod.object.type == 'ARMATURE':
+            bones.update(bone.name for bone in mod.object.data.bones if bone.use_deform)
+    return np.array([g.name in bones for g in obj.vertex_groups], dtype=bool)
+
+def clean_weights(obj, normalize=True, limit=4, smooth_iterations=1, smooth_factor=0.5, subset='BONE_DEFORM'):
+    """Smooth, limit and normalise the deform groups of obj in one read and one write.
+
+    Locked groups inside the subset keep their weights but still count towards
+    the influence limit and the normalised total. Groups outside the subset,
+    such as modifier masks, are never touched. Returns the number of weights
+    written or removed, or None when no group can be edited.
+    """
+    matrix = read_weight_matrix(obj)
+    count, group_count = matrix.vertex_count, len(obj.vertex_groups)
+    selected = deform_group_mask(obj, subset)
+    locked = np.array([g.lock_weight for g in obj.vertex_groups], dtype=bool)
+    editable = selected & ~locked
+    if not editable.any():
+        return None
+
+    all_rows = matrix.rows().astype(np.int64)
+    fixed = (selected & locked)[matrix.groups]
+    locked_total = np.bincount(all_rows[fixed], weights=matrix.weights[fixed], minlength=count)
+    locked_count = np.bincount(all_rows[fixed], minlength=count)
+
+    pick = editable[matrix.groups]
+    rows, groups, weights = all_rows[pick], matrix.groups[pick], matrix.weights[pick].astype(np.float64)
+    if smooth_iterations > 0 and smooth_factor > 0:
+        rows, groups, weights = smooth_entries(rows, groups, weights, read_edges(obj.data), count,
+                                               group_count, smooth_factor, smooth_iterations)
+    if limit > 0:
+        rows, groups, weights = limit_entries(rows, groups, weights, np.maximum(limit - locked_count, 0))
+    if normalize:
+        weights = normalize_entries(rows, weights, count, np.clip(1.0 - locked_total, 0.0, 1.0))
+
+    return write_weight_entries(obj, matrix, rows, groups, weights, np.flatnonzero(editable))
+
+# Weight Snapshots
+
+# Keeps the dynamic snapshot list alive, Blender does not copy the item strings
+_snapshot_items = []
+
+def snapshot_dir():
+    """Folder next to the saved .blend file that holds its weight snapshots"""
+    if not bpy.data.filepath:
+        return None
+    return os.path.splitext(bpy.data.filepath)[0] + "_weights"
+
+def snapshot_path(name, stamp):
+    return os.path.join(snapshot_dir(), f"{bpy.path.clean_name(name)}_{stamp}.npz")
+
+def list_snapshots(stamp):
+    """(name, path) of the snapshots saved for meshes with topology hash stamp"""
+    folder = snapshot_dir()
+    if not folder or not os.path.isdir(folder):
+        return []
+    suffix = f"_{stamp}.npz"
+    return [(f[:-len(suffix)], os.path.join(folder, f)) for f in sorted(os.listdir(folder)) if f.endswith(suffix)]
+
+def save_weight_snapshot(obj, path, precision='FLOAT16'):
+    """Write all of obj's vertex groups to a compressed .npz file"""
+    matrix = read_weight_matrix(obj)
+    small = len(obj.vertex_groups) < 1 << 16
+    np.savez_compressed(
+        path,
+        topology_hash=np.array(topology_hash(obj.data)),
+        group_names=np.array([g.name for g in obj.vertex_groups], dtype=str),
+        indptr=matrix.indptr.astype(np.int32 if matrix.indptr[-1] < 1 << 31 else np.int64),
+        groups=matrix.groups.astype(np.uint16 if small else np.int32),
+        weights=matrix.weights.astype(np.float16 if precision == 'FLOAT16' else np.float32),
+    )
+    return len(matrix.weights)
+
+def load_weight_snapshot(obj, path):
+    """Replace obj's vertex group weights with a snapshot.
+
+    Returns None when the snapshot was saved from a different topology,
+    otherwise the number of weights written or removed.
+    """
+    # Members are read on access, so a mismatched hash skips the weight arrays
+    with np.load(path) as data:
+        if str(data["topology_hash"]) != topology_hash(obj.data):
+            return None
+        names = data["group_names"].tolist()
+        snapshot = WeightMatrix(data["indptr"].astype(np.int64), data["groups"].astype(np.int32),
+                                data["weights"].astype(np.float32))
+
+    target_groups = np.empty(len(names), dtype=np.int64)
+    for i, name in enumerate(names):
+        group = obj.vertex_groups.get(name)
+        if group is None:
+            group = obj.vertex_groups.new(name=name)
+        target_groups[i] = group.index
+    # Groups missing from the snapshot are written empty, which clears them
+    return write_weight_entries(obj, read_weight_matrix(obj), snapshot.rows(), target_groups[snapshot.groups],
+                                snapshot.weights, np.arange(len(obj.vertex_groups)))
 
 # Panel + Operators
 
+def conflict_note(conflicts):
+    if not conflicts:
+        return ""
+    return f", {conflicts} topology conflicts: select two vertices of a center edge as the seed and retry"
+
 class VGWT_OT_CopyWeights(bpy.types.Operator):
     bl_idname = "vgwt.copy_weights"
     bl_label = "Copy Weights"
@@ -94,10 +717,10 @@ class VGWT_OT_PasteWeights(bpy.types.Operator):
             self.report({'ERROR'}, "No active vertex group")
             return {'CANCELLED'}
         global temp_weights
-        if not temp_weights:
+        if temp_weights is None:
             self.report({'ERROR'}, "No weights stored. Use Copy first.")
             return {'CANCELLED'}
-        set_vertex_group_weights(obj, group, temp_weights)
+        set_vertex_group_weights(obj, group, *temp_weights)
         self.report({'INFO'}, f"Pasted weights to group: {group.name}")
         return {'FINISHED'}
 
@@ -119,8 +742,176 @@ class VGWT_OT_MirrorWeights(bpy.types.Operator):
             self.report({'ERROR'}, "No active vertex group")
             return {'CANCELLED'}
         replace = context.scene.vgwt_replace_weights
-        mirror_vertex_group(obj, group, self.axis, replace)
-        self.report({'INFO'}, f"Mirrored weights for '{group.name}' on {self.axis} axis (replace={replace})")
+        unmatched, conflicts = mirror_vertex_group(obj, group, self.axis, replace, context.scene.vgwt_mirror_tolerance,
+                                                   context.scene.vgwt_mirror_method)
+        self.report({'WARNING'} if unmatched or conflicts else {'INFO'},
+                    f"Mirrored weights for '{group.name}' on {self.axis} axis (replace={replace}, "
+                    f"{unmatched} unmatched vertices){conflict_note(conflicts)}")
+        return {'FINISHED'}
+
+class VGWT_OT_MirrorSidePairs(bpy.types.Operator):
+    bl_idname = "vgwt.mirror_side_pairs"
+    bl_label = "Mirror Left/Right Groups"
+    bl_description = "Mirror every .L/.R, _l/_r and Left/Right vertex group pair in one pass"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    axis: EnumProperty(
+        items=[('X', "X Axis", ""), ('Y', "Y Axis", ""), ('Z', "Z Axis", "")],
+        name="Axis",
+        default='X'
+    )
+    direction: EnumProperty(
+        items=[('L_TO_R', "Left to Right", ""), ('R_TO_L', "Right to Left", "")],
+        name="Direction",
+        default='L_TO_R'
+    )
+
+    def execute(self, context):
+        obj = context.object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Object must be a mesh")
+            return {'CANCELLED'}
+        scene = context.scene
+        pairs, unmatched, conflicts = mirror_side_groups(obj, self.axis, self.direction, scene.vgwt_replace_weights,
+                                              scene.vgwt_mirror_tolerance, scene.vgwt_mirror_method)
+        if not pairs:
+            self.report({'ERROR'}, "No left/right vertex group pairs found")
+            return {'CANCELLED'}
+        self.report({'WARNING'} if unmatched or conflicts else {'INFO'},
+                    f"Mirrored {pairs} group pairs on {self.axis} axis ({unmatched} unmatched weights)"
+                    f"{conflict_note(conflicts)}")
+        return {'FINISHED'}
+
+class VGWT_OT_TransferWeights(bpy.types.Operator):
+    bl_idname = "vgwt.transfer_weights"
+    bl_label = "Transfer Weights (Nearest Surface)"
+    bl_description = "Interpolate all vertex groups of the active mesh onto the selected meshes, whatever their topology"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        source = context.object
+        if not source or source.type != 'MESH':
+            self.report({'ERROR'}, "Active object must be a mesh")
+            return {'CANCELLED'}
+        targets = [o for o in context.selected_objects if o.type == 'MESH' and o != source]
+        if not targets:
+            self.report({'ERROR'}, "Select target meshes, then the source mesh last")
+            return {'CANCELLED'}
+
+        original_mode = source.mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+        for target in targets:
+            transfer_weights(source, target)
+        if source.mode != original_mode:
+            bpy.ops.object.mode_set(mode=original_mode)
+
+        self.report({'INFO'}, f"Transferred {len(source.vertex_groups)} groups to {len(targets)} meshes")
+        return {'FINISHED'}
+
+class VGWT_OT_CleanWeights(bpy.types.Operator):
+    bl_idname = "vgwt.clean_weights"
+    bl_label = "Clean Up Weights"
+    bl_description = "Smooth, limit influences and normalise the unlocked deform groups in one pass"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    subset: EnumProperty(
+        items=[('BONE_DEFORM', "Deform Pose Bones", "Groups of deforming bones in the Armature modifiers"),
+               ('ALL', "All Groups", "Every vertex group, including masks and other non-deform groups")],
+        name="Subset",
+        default='BONE_DEFORM'
+    )
+    normalize: BoolProperty(name="Normalize", default=True)
+    limit: IntProperty(name="Max Influences", description="0 keeps every influence", default=4, min=0)
+    smooth_iterations: IntProperty(name="Smooth Iterations", default=1, min=0, max=100)
+    smooth_factor: FloatProperty(name="Smooth Factor", default=0.5, min=0.0, max=1.0)
+
+    def execute(self, context):
+        obj = context.object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Object must be a mesh")
+            return {'CANCELLED'}
+
+        original_mode = obj.mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+        written = clean_weights(obj, self.normalize, self.limit, self.smooth_iterations, self.smooth_factor,
+                                self.subset)
+        if obj.mode != original_mode:
+            bpy.ops.object.mode_set(mode=original_mode)
+
+        if written is None:
+            self.report({'ERROR'}, "No unlocked groups in the subset (deform groups need an Armature modifier)")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Updated {written} weights")
+        return {'FINISHED'}
+
+class VGWT_OT_SaveSnapshot(bpy.types.Operator):
+    bl_idname = "vgwt.save_weight_snapshot"
+    bl_label = "Save Weight Snapshot"
+    bl_description = "Save all vertex groups to a compressed file next to the .blend"
+
+    precision: EnumProperty(
+        items=[('FLOAT16', "Half", "Half precision weights, smallest files"),
+               ('FLOAT32', "Full", "Full precision weights")],
+        name="Precision",
+        default='FLOAT16'
+    )
+
+    def execute(self, context):
+        obj = context.object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Object must be a mesh")
+            return {'CANCELLED'}
+        if not snapshot_dir():
+            self.report({'ERROR'}, "Save the .blend file first")
+            return {'CANCELLED'}
+        name = context.scene.vgwt_snapshot_name.strip()
+        if not name:
+            self.report({'ERROR'}, "Enter a snapshot name")
+            return {'CANCELLED'}
+
+        os.makedirs(snapshot_dir(), exist_ok=True)
+        path = snapshot_path(name, topology_hash(obj.data))
+        count = save_weight_snapshot(obj, path, self.precision)
+        self.report({'INFO'}, f"Saved {count} weights to {path}")
+        return {'FINISHED'}
+
+def snapshot_items(self, context):
+    _snapshot_items.clear()
+    obj = context.object
+    if obj and obj.type == 'MESH':
+        for name, path in list_snapshots(topology_hash(obj.data)):
+            _snapshot_items.append((path, name, path))
+    if not _snapshot_items:
+        _snapshot_items.append(('NONE', "No Snapshots", "No snapshots match this mesh"))
+    return _snapshot_items
+
+class VGWT_OT_LoadSnapshot(bpy.types.Operator):
+    bl_idname = "vgwt.load_weight_snapshot"
+    bl_label = "Load Weight Snapshot"
+    bl_description = "Replace all vertex group weights with a saved snapshot of the same topology"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    snapshot: EnumProperty(items=snapshot_items, name="Snapshot")
+
+    def execute(self, context):
+        obj = context.object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Object must be a mesh")
+            return {'CANCELLED'}
+        if self.snapshot == 'NONE' or not os.path.isfile(self.snapshot):
+            self.report({'ERROR'}, "No snapshot to load")
+            return {'CANCELLED'}
+
+        original_mode = obj.mode
+        bpy.ops.object.mode_set(mode='OBJECT')
+        written = load_weight_snapshot(obj, self.snapshot)
+        if obj.mode != original_mode:
+            bpy.ops.object.mode_set(mode=original_mode)
+
+        if written is None:
+            self.report({'ERROR'}, "Snapshot was saved from a mesh with different topology")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Loaded snapshot, updated {written} weights")
         return {'FINISHED'}
 
 class VGWT_OT_ClearGroup(bpy.types.Operator):
@@ -134,45 +925,31 @@ class VGWT_OT_ClearGroup(bpy.types.Operator):
         if not group:
             self.report({'ERROR'}, "No active vertex group")
             return {'CANCELLED'}
-        group.remove([v.index for v in obj.data.vertices])
+        clear_vertex_group(obj, group)
         self.report({'INFO'}, f"Cleared weights for group: {group.name}")
         return {'FINISHED'}
 
-def mirror_weight_buffer(obj, axis):
+def mirror_weight_buffer(obj, axis, tolerance=0.001, method='POSITION'):
+    """Mirror the copy buffer.
+
+    Returns the number of unmatched vertices and of topology conflicts, or None without a buffer.
+    """
     global temp_weights
-    if not temp_weights:
-        return False
+    if temp_weights is None:
+        return None
     original_mode = obj.mode
     bpy.ops.object.mode_set(mode='OBJECT')
-    mesh = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.verts.ensure_lookup_table()
-
-    pos_to_index = {(round(v.co.x, 6), round(v.co.y, 6), round(v.co.z, 6)): v.index for v in bm.verts}
-    index_map = {}
-
-    for v in bm.verts:
-        mirrored = v.co.copy()
-        if axis == 'X': mirrored.x *= -1
-        elif axis == 'Y': mirrored.y *= -1
-        elif axis == 'Z': mirrored.z *= -1
-
-        key = tuple(round(c, 6) for c in mirrored)
-        if key in pos_to_index:
-            index_map[v.index] = pos_to_index[key]
-
-    mirrored_weights = {}
-    for src_idx, tgt_idx in index_map.items():
-        if src_idx in temp_weights:
-            mirrored_weights[tgt_idx] = temp_weights[src_idx]
-
-    temp_weights = mirrored_weights
-    bm.free()
-    # original_mode = obj.mode
+
+    indices, weights = temp_weights
+    mirror, conflicts = get_mirror_map(obj, axis, tolerance, method)
+    valid = indices < len(mirror)
+    targets = mirror[indices[valid]]
+    found = targets >= 0
+    temp_weights = (targets[found], weights[valid][found])
+
     if obj.mode != original_mode:
         bpy.ops.object.mode_set(mode=original_mode)
-    return True
+    return len(indices) - len(temp_weights[0]), conflicts
 
 class VGWT_OT_MirrorBuffer(bpy.types.Operator):
     bl_idname = "vgwt.mirror_buffer"
@@ -191,11 +968,16 @@ class VGWT_OT_MirrorBuffer(bpy.types.Operator):
             self.report({'ERROR'}, "Object must be a mesh")
             return {'CANCELLED'}
 
-        if not mirror_weight_buffer(obj, self.axis):
+        result = mirror_weight_buffer(obj, self.axis, context.scene.vgwt_mirror_tolerance,
+                                      context.scene.vgwt_mirror_method)
+        if result is None:
             self.report({'ERROR'}, "No copied weights to mirror")
             return {'CANCELLED'}
 
-        self.report({'INFO'}, f"Mirrored buffer weights across {self.axis} axis")
+        unmatched, conflicts = result
+        self.report({'WARNING'} if unmatched or conflicts else {'INFO'},
+                    f"Mirrored buffer weights across {self.axis} axis ({unmatched} unmatched vertices)"
+                    f"{conflict_note(conflicts)}")
         return {'FINISHED'}
 
 
@@ -224,12 +1006,29 @@ class VGWT_PT_ToolsPanel(bpy.types.Panel):
         layout.separator()
         layout.label(text="Mirror Existing Weights:")
         layout.prop(scene, "vgwt_replace_weights")
+        layout.prop(scene, "vgwt_mirror_method")
+        layout.prop(scene, "vgwt_mirror_tolerance")
 
         row = layout.row(align=True)
         row.operator("vgwt.mirror_weights", text="X-ex").axis = 'X'
         row.operator("vgwt.mirror_weights", text="Y-ex").axis = 'Y'
         row.operator("vgwt.mirror_weights", text="Z-ex").axis = 'Z'
 
+        row = layout.row(align=True)
+        row.operator("vgwt.mirror_side_pairs", text="L → R").direction = 'L_TO_R'
+        row.operator("vgwt.mirror_side_pairs", text="R → L").direction = 'R_TO_L'
+
+        layout.separator()
+        layout.operator("vgwt.transfer_weights")
+        layout.operator("vgwt.clean_weights")
+
+        layout.separator()
+        layout.label(text="Weight Snapshots:")
+        layout.prop(scene, "vgwt_snapshot_name", text="")
+        row = layout.row(align=True)
+        row.operator("vgwt.save_weight_snapshot", text="Save")
+        row.operator_menu_enum("vgwt.load_weight_snapshot", "snapshot", text="Load")
+
         layout.separator()
         layout.operator("vgwt.clear_weights", icon='X')
 
@@ -237,6 +1036,11 @@ classes = [
     VGWT_OT_CopyWeights,
     VGWT_OT_PasteWeights,
     VGWT_OT_MirrorWeights,
+    VGWT_OT_MirrorSidePairs,
+    VGWT_OT_TransferWeights,
+    VGWT_OT_CleanWeights,
+    VGWT_OT_SaveSnapshot,
+    VGWT_OT_LoadSnapshot,
     VGWT_PT_ToolsPanel,
     VGWT_OT_ClearGroup,
     VGWT_OT_MirrorBuffer
@@ -248,11 +1052,32 @@ def register():
         description="Replace existing weights on mirrored side",
         default=True
     )
+    bpy.types.Scene.vgwt_mirror_tolerance = bpy.props.FloatProperty(
+        name="Mirror Tolerance",
+        description="Maximum distance between a vertex and its mirrored position",
+        default=0.001,
+        min=0.0,
+        precision=4
+    )
+    bpy.types.Scene.vgwt_snapshot_name = StringProperty(
+        name="Snapshot Name",
+        description="Name used when saving a weight snapshot",
+        default="weights"
+    )
+    bpy.types.Scene.vgwt_mirror_method = EnumProperty(
+        items=[('POSITION', "Position", "Match vertices by mirrored position"),
+               ('TOPOLOGY', "Topology", "Match vertices by mesh connectivity from the selected or most central edge")],
+        name="Mirror Method",
+        default='POSITION'
+    )
     for cls in classes:
         bpy.utils.register_class(cls)
 
 def unregister():
     del bpy.types.Scene.vgwt_replace_weights
+    del bpy.types.Scene.vgwt_mirror_tolerance
+    del bpy.types.Scene.vgwt_mirror_method
+    del bpy.types.Scene.vgwt_snapshot_name
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 